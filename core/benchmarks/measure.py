@@ -0,0 +1,72 @@
+import statistics
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass
+class StageResult:
+    timings: List[float] = field(default_factory=list)
+    peak_memory: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "min": min(self.timings),
+            "median": statistics.median(self.timings),
+            "mean": statistics.mean(self.timings),
+            "repeat": len(self.timings),
+            "peak_memory": self.peak_memory,
+        }
+
+
+def measure_time(func: Callable[[], T]) -> Tuple[T, float]:
+    start = time.perf_counter()
+    res = func()
+    return res, time.perf_counter() - start
+
+
+def measure_peak_memory(func: Callable[[], T]) -> Tuple[T, int]:
+    # tracing slows down execution, so it's done apart from timing
+    tracemalloc.start()
+
+    try:
+        res = func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return res, peak
+
+
+def compare(
+    baseline: Dict[str, Dict[str, Dict[str, Any]]],
+    current: Dict[str, Dict[str, Dict[str, Any]]],
+    threshold: float,
+) -> List[str]:
+    """Compare stage medians of two results keyed by case and stage names."""
+    regressions = []
+
+    for case_name, stages in current.items():
+        if "error" in stages:
+            regressions.append("{}: {}".format(case_name, stages["error"]))
+            continue
+
+        for stage_name, stage in stages.items():
+            base = baseline.get(case_name, {}).get(stage_name)
+
+            if not isinstance(base, dict):
+                continue
+
+            ratio = stage["median"] / base["median"] if base["median"] else 1.0
+
+            if ratio > threshold:
+                regressions.append(
+                    "{}.{}: {:.4f}s -> {:.4f}s (x{:.2f})".format(
+                        case_name, stage_name, base["median"], stage["median"], ratio
+                    )
+                )
+
+    return regressions
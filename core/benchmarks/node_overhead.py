@@ -0,0 +1,183 @@
+"""Per-node overhead of ParseColumnLineageRunner over a generated project.
+
+The current runner keeps lineage alongside compiled nodes. The former one is restored
+as `RoundTripRunner`, which round-trips every compiled node through `to_dict`/`from_dict`
+into a node subclass holding lineage, as the runner did before. Both run the whole runner
+code path, compilation and lineage parsing included, with the fake adapter of
+`benchmarks.project`. Run from the `core` directory:
+
+    python -m benchmarks.node_overhead --models 100 --columns 200
+"""
+import argparse
+import json
+import sys
+import tempfile
+import tracemalloc
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Type
+
+import networkx as nx
+from benchmarks.measure import StageResult, measure_peak_memory, measure_time
+from benchmarks.project.adapter import install_fake_adapter
+from benchmarks.project.generate import ProjectSpec, generate_project
+from dbt import flags
+from dbt.adapters.factory import get_adapter
+from dbt.config.profile import read_user_config
+from dbt.contracts.graph.compiled import CompiledModelNode
+from dbt.contracts.results import RunStatus
+from dbt.task.compile import CompileRunner
+from dbt.tracking import do_not_track
+from dbt_column_lineage.dbt.main import parse_args as parse_cli_args
+from dbt_column_lineage.dbt.schemas.lineage import ColumnsLineage
+from dbt_column_lineage.dbt.services.lineage import get_model_columns_lineage
+from dbt_column_lineage.dbt.tasks.parse import (
+    ParseColumnLineageRunner,
+    ParseColumnLineageTask,
+)
+
+
+@dataclass
+class ParsedColumnLineageNode(CompiledModelNode):
+    columns_lineage: ColumnsLineage = field(default_factory=list)
+
+
+class RoundTripRunner(ParseColumnLineageRunner):
+    """The runner as it was before lineage was carried alongside nodes."""
+
+    def compile(self, manifest) -> ParsedColumnLineageNode:
+        measure = self.lineage_options.get_measure(self.node.unique_id)
+
+        with measure("compile"):
+            node = CompileRunner.compile(self, manifest)
+
+        columns_lineage = get_model_columns_lineage(
+            self.columns_lookup, manifest, node, self.lineage_options, self.columns
+        ).columns
+
+        with measure("round_trip"):
+            data = node.to_dict(omit_none=True)
+            data["columns_lineage"] = [
+                column_lineage.to_dict(omit_none=True) for column_lineage in columns_lineage
+            ]
+            node = ParsedColumnLineageNode.from_dict(data)
+
+        return node
+
+
+class RoundTripTask(ParseColumnLineageTask):
+    def get_runner_type(self, _):
+        return RoundTripRunner
+
+
+def create_task(
+    directory: str, spec: ProjectSpec, task_cls: Type[ParseColumnLineageTask]
+) -> ParseColumnLineageTask:
+    parsed = parse_cli_args(["--profiles-dir", directory, "parse", "--project-dir", directory])
+
+    user_config = read_user_config(directory)
+    user_config.write_json = False
+    flags.set_from_args(parsed, user_config)
+
+    task = task_cls.from_args(parsed)
+    install_fake_adapter(task.config, spec.columns, 0.0)
+
+    task._runtime_initialize()
+    selected_uids = {node.unique_id for node in task._flattened_nodes}
+    task.before_run(get_adapter(task.config), selected_uids)
+
+    return task
+
+
+def get_nodes(task: ParseColumnLineageTask) -> List[Any]:
+    # parents are compiled first, as they are by a graph queue
+    order = nx.topological_sort(task.graph.graph)
+    return [task.manifest.nodes[unique_id] for unique_id in order]
+
+
+def run_nodes(task: ParseColumnLineageTask, nodes: List[Any]) -> List[Any]:
+    results = []
+
+    for node in nodes:
+        result = task.get_runner(node).safe_run(task.manifest)
+
+        if result.status == RunStatus.Error:
+            raise RuntimeError("{} failed: {}".format(node.unique_id, result.message))
+
+        results.append(result)
+
+    return results
+
+
+def measure_retained_memory(task: ParseColumnLineageTask, nodes: List[Any]) -> int:
+    # results hold returned nodes, lineage is held by them or by the task
+    task.models_columns_lineage.clear()
+    tracemalloc.start()
+
+    try:
+        results = run_nodes(task, nodes)
+        retained, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    del results
+    return retained
+
+
+def run(task: ParseColumnLineageTask, repeat: int) -> Dict[str, Any]:
+    nodes = get_nodes(task)
+    # columns are introspected and templates are cached by the first run
+    run_nodes(task, nodes)
+
+    result = StageResult()
+
+    for _ in range(repeat):
+        for node in nodes:
+            runner = task.get_runner(node)
+            _, timing = measure_time(lambda: runner.safe_run(task.manifest))
+            result.timings.append(timing)
+
+    for node in nodes:
+        runner = task.get_runner(node)
+        _, peak = measure_peak_memory(lambda: runner.safe_run(task.manifest))
+        result.peak_memory = max(result.peak_memory, peak)
+
+    round_trip = task.timings.stages().get("round_trip")
+
+    return {
+        "node": result.to_dict(),
+        "retained_memory_per_node": measure_retained_memory(task, nodes) // len(nodes),
+        "round_trip_per_node": round_trip.total / round_trip.calls if round_trip else 0.0,
+    }
+
+
+def main(args: List[str]) -> int:
+    p = argparse.ArgumentParser(prog="python -m benchmarks.node_overhead")
+    p.add_argument("--models", type=int, default=100)
+    p.add_argument("--depth", type=int, default=5, help="Number of layers of the DAG.")
+    p.add_argument("--columns", type=int, default=200, help="Number of columns per model.")
+    p.add_argument("--repeat", type=int, default=5)
+    parsed = p.parse_args(args)
+
+    do_not_track()
+
+    spec = ProjectSpec(models=parsed.models, depth=parsed.depth, columns=parsed.columns)
+    directory = tempfile.mkdtemp(prefix="column_lineage_benchmark_")
+    generate_project(directory, spec)
+
+    report: Dict[str, Any] = {"models": spec.models, "columns": spec.columns}
+
+    for name, task_cls in (("before", RoundTripTask), ("after", ParseColumnLineageTask)):
+        task = create_task(directory, spec, task_cls)
+
+        try:
+            report[name] = run(task, parsed.repeat)
+        finally:
+            task.close_introspector()
+
+    print(json.dumps(report, indent=2))
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,146 @@
+"""Micro-benchmarks of parser stages over synthetic SQL.
+
+Run from the `core` directory:
+
+    python -m benchmarks.parser --output parser.json
+    python -m benchmarks.parser --baseline parser.json --threshold 1.2
+    python -m benchmarks.parser --backend pglast --backend <other>
+"""
+import argparse
+import json
+import platform
+import sys
+from typing import Any, Dict, List
+
+from benchmarks.measure import StageResult, compare, measure_peak_memory, measure_time
+from benchmarks.parser.sql import GENERATORS, Case
+from dbt_column_lineage.parser.backends.base import ParserBackend
+from dbt_column_lineage.parser.backends.registry import get_backend, get_backend_names
+from dbt_column_lineage.parser.services.lineage import get_columns_lineage
+from dbt_column_lineage.parser.services.resolve import resolve
+
+STAGES = ("parse", "resolve", "get_columns_lineage")
+
+
+def run_stages(case: Case, backend: ParserBackend, measure) -> Dict[str, Any]:
+    (root, ctes), parse_res = measure(lambda: backend.parse(case.sql))
+    _, resolve_res = measure(lambda: resolve(root, ctes, case.relations))
+    _, lineage_res = measure(lambda: get_columns_lineage(root))
+
+    return dict(zip(STAGES, (parse_res, resolve_res, lineage_res)))
+
+
+def run_case(case: Case, backend: ParserBackend, repeat: int) -> Dict[str, Dict[str, Any]]:
+    results = {stage: StageResult() for stage in STAGES}
+
+    # statements are changed by resolving, so every run starts from parsing
+    for stage, peak_memory in run_stages(case, backend, measure_peak_memory).items():
+        results[stage].peak_memory = peak_memory
+
+    for _ in range(repeat):
+        for stage, timing in run_stages(case, backend, measure_time).items():
+            results[stage].timings.append(timing)
+
+    return {stage: result.to_dict() for stage, result in results.items()}
+
+
+def parse_args(args: List[str]) -> argparse.Namespace:
+    p = argparse.ArgumentParser(prog="python -m benchmarks.parser")
+
+    p.add_argument(
+        "--case",
+        dest="cases",
+        action="append",
+        choices=list(GENERATORS),
+        help="Case to run, all cases are run by default.",
+    )
+    p.add_argument(
+        "--backend",
+        dest="backends",
+        action="append",
+        choices=list(get_backend_names()),
+        help="Parser backend to run cases with, may be repeated to compare backends.",
+    )
+    p.add_argument(
+        "--scale",
+        type=float,
+        default=1.0,
+        help="Multiplier of default case sizes.",
+    )
+    p.add_argument("--repeat", type=int, default=5)
+    p.add_argument("--output", type=str, help="Path to write JSON results to.")
+    p.add_argument("--baseline", type=str, help="Path to JSON results to compare with.")
+    p.add_argument(
+        "--threshold",
+        type=float,
+        default=1.2,
+        help="Max allowed ratio of stage median to the baseline one.",
+    )
+
+    return p.parse_args(args)
+
+
+def run(parsed: argparse.Namespace) -> Dict[str, Dict[str, Any]]:
+    results = {}
+
+    for backend_name in parsed.backends or [None]:
+        backend = get_backend(backend_name)
+        backend_results = results.setdefault(backend.name, {})
+
+        for case_name in parsed.cases or GENERATORS:
+            generator, size = GENERATORS[case_name]
+            size = max(1, int(size * parsed.scale))
+
+            try:
+                backend_results[case_name] = run_case(generator(size), backend, parsed.repeat)
+            except Exception as e:
+                # keep on running other cases, failed one is reported as is
+                backend_results[case_name] = {"error": repr(e)}
+
+    return results
+
+
+def check_baseline(parsed: argparse.Namespace, results: Dict[str, Dict[str, Any]]) -> int:
+    with open(parsed.baseline) as f:
+        baseline = json.load(f)
+
+    regressions = []
+
+    for backend_name, backend_results in results.items():
+        backend_baseline = baseline["backends"].get(backend_name, {})
+        backend_regressions = compare(backend_baseline, backend_results, parsed.threshold)
+        regressions.extend(
+            "{}: {}".format(backend_name, regression) for regression in backend_regressions
+        )
+
+    for regression in regressions:
+        print("regression: {}".format(regression), file=sys.stderr)
+
+    return 1 if regressions else 0
+
+
+def main(args: List[str]) -> int:
+    parsed = parse_args(args)
+    results = run(parsed)
+
+    report = {
+        "python": platform.python_version(),
+        "scale": parsed.scale,
+        "backends": results,
+    }
+    data = json.dumps(report, indent=2)
+
+    if parsed.output:
+        with open(parsed.output, "w") as f:
+            f.write(data)
+    else:
+        print(data)
+
+    if parsed.baseline:
+        return check_baseline(parsed, results)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
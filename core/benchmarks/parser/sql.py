@@ -0,0 +1,148 @@
+"""Generators of synthetic compiled SQL shaped like dbt models."""
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Tuple
+
+from dbt_column_lineage.parser.schemas.relation import Path, Relation
+
+DATABASE = "analytics"
+SCHEMA = "raw"
+
+
+@dataclass
+class Case:
+    name: str
+    sql: str
+    relations: List[Relation]
+
+
+def make_relation(identifier: str, column_count: int) -> Relation:
+    return Relation(
+        path=Path(database=DATABASE, schema=SCHEMA, identifier=identifier),
+        field_names=tuple("col_{}".format(i) for i in range(column_count)),
+    )
+
+
+def render_relation(relation: Relation) -> str:
+    path = relation.path
+    return '"{}"."{}"."{}"'.format(path.database, path.schema, path.identifier)
+
+
+def cte_chain(size: int) -> Case:
+    """`size` CTEs where each one selects columns of the previous one with an expression."""
+    relation = make_relation("raw_table", 20)
+    columns = relation.field_names
+
+    ctes = ["cte_0 as (select {} from {})".format(", ".join(columns), render_relation(relation))]
+
+    for i in range(1, size):
+        targets = ["{} + {} as {}".format(columns[0], i, columns[0]), *columns[1:]]
+        ctes.append("cte_{} as (select {} from cte_{})".format(i, ", ".join(targets), i - 1))
+
+    sql = "with {}\nselect * from cte_{}".format(",\n".join(ctes), size - 1)
+
+    return Case(name="cte_chain", sql=sql, relations=[relation])
+
+
+def wide_select(size: int) -> Case:
+    """One CTE and a final select of `size` explicit columns."""
+    relation = make_relation("raw_table", size)
+    targets = ", ".join(
+        "{} as {}_renamed".format(column, column) for column in relation.field_names
+    )
+    sql = "with source as (select * from {})\nselect {} from source".format(
+        render_relation(relation), targets
+    )
+
+    return Case(name="wide_select", sql=sql, relations=[relation])
+
+
+def many_joins(size: int) -> Case:
+    """`size` relations joined together, a few qualified columns are taken from each."""
+    relations = [make_relation("raw_table_{}".format(i), 5) for i in range(size)]
+
+    targets = []
+    joins = ["{} as t0".format(render_relation(relations[0]))]
+
+    for i, relation in enumerate(relations):
+        targets.extend(
+            "t{}.{} as t{}_{}".format(i, column, i, column) for column in relation.field_names
+        )
+
+        if i:
+            joins.append(
+                "left join {} as t{} on t{}.col_0 = t0.col_0".format(
+                    render_relation(relation), i, i
+                )
+            )
+
+    sql = "with joined as (select {} from {})\nselect * from joined".format(
+        ", ".join(targets), "\n".join(joins)
+    )
+
+    return Case(name="many_joins", sql=sql, relations=relations)
+
+
+def star_expansion(size: int) -> Case:
+    """Several wide relations expanded with `*` in every statement."""
+    relations = [make_relation("raw_table_{}".format(i), size) for i in range(3)]
+
+    ctes = [
+        "s{} as (select * from {})".format(i, render_relation(relation))
+        for i, relation in enumerate(relations)
+    ]
+    ctes.append("unioned as (select s0.*, s1.*, s2.* from s0, s1, s2)")
+    sql = "with {}\nselect * from unioned".format(",\n".join(ctes))
+
+    # names of columns must be unique inside of one statement
+    relations = [
+        Relation(
+            path=relation.path,
+            field_names=tuple("s{}_{}".format(i, name) for name in relation.field_names),
+        )
+        for i, relation in enumerate(relations)
+    ]
+
+    return Case(name="star_expansion", sql=sql, relations=relations)
+
+
+def nested_expressions(size: int) -> Case:
+    """A column wrapped into `size` levels of nested function calls and arithmetics."""
+    relation = make_relation("raw_table", 3)
+
+    expression = "col_0"
+    for i in range(size):
+        expression = "coalesce(({} + col_1) * {}, col_2)".format(expression, i)
+
+    sql = "with source as (select * from {})\nselect {} as nested from source".format(
+        render_relation(relation), expression
+    )
+
+    return Case(name="nested_expressions", sql=sql, relations=[relation])
+
+
+def long_comments(size: int) -> Case:
+    """A small model surrounded and interleaved with `size` lines of comments."""
+    relation = make_relation("raw_table", 10)
+    comment = "-- {}\n".format("lorem ipsum dolor sit amet " * 4)
+    block_comment = "/* {} */\n".format("consectetur adipiscing elit " * 4)
+
+    targets = ",\n".join(
+        "{}{} as {}".format(comment * (size // 20), column, column)
+        for column in relation.field_names
+    )
+    sql = "{}with source as (\n{}select * from {})\nselect\n{}\nfrom source".format(
+        block_comment * size, comment * size, render_relation(relation), targets
+    )
+
+    return Case(name="long_comments", sql=sql, relations=[relation])
+
+
+# case name -> (generator, default size)
+GENERATORS: Dict[str, Tuple[Callable[[int], Case], int]] = {
+    "cte_chain": (cte_chain, 50),
+    "wide_select": (wide_select, 500),
+    "many_joins": (many_joins, 30),
+    "star_expansion": (star_expansion, 1000),
+    "nested_expressions": (nested_expressions, 50),
+    "long_comments": (long_comments, 500),
+}
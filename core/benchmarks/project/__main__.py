@@ -0,0 +1,119 @@
+"""End-to-end benchmark of the parse task over a generated dbt project.
+
+Run from the `core` directory:
+
+    python -m benchmarks.project --models 500 --depth 10 --latency 0.2 --threads 1 4 16
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from typing import Any, Dict, List
+
+from benchmarks.project.adapter import install_fake_adapter
+from benchmarks.project.generate import ProjectSpec, generate_project
+from dbt import flags
+from dbt.config.profile import read_user_config
+from dbt.tracking import do_not_track
+from dbt_column_lineage.dbt.main import parse_args as parse_cli_args
+
+
+def run_parse(directory: str, spec: ProjectSpec, threads: int, latency: float) -> float:
+    parsed = parse_cli_args(
+        [
+            "--profiles-dir",
+            directory,
+            "parse",
+            "--project-dir",
+            directory,
+            "--threads",
+            str(threads),
+        ]
+    )
+
+    user_config = read_user_config(directory)
+    user_config.write_json = False
+
+    flags.set_from_args(parsed, user_config)
+    parsed.cls.set_log_format()
+
+    task = parsed.cls.from_args(parsed)
+    install_fake_adapter(task.config, spec.columns, latency)
+
+    start = time.perf_counter()
+    task.run()
+    return time.perf_counter() - start
+
+
+def parse_args(args: List[str]) -> argparse.Namespace:
+    p = argparse.ArgumentParser(prog="python -m benchmarks.project")
+
+    p.add_argument("--models", type=int, default=200)
+    p.add_argument("--depth", type=int, default=5, help="Number of layers of the DAG.")
+    p.add_argument("--columns", type=int, default=20, help="Number of columns per model.")
+    p.add_argument(
+        "--latency",
+        type=float,
+        default=0.0,
+        help="Seconds every column introspection call takes.",
+    )
+    p.add_argument("--threads", type=int, nargs="+", default=[1, 4])
+    p.add_argument(
+        "--project-dir",
+        type=str,
+        help="Directory to generate the project in, a temporary one by default.",
+    )
+    p.add_argument("--output", type=str, help="Path to write JSON results to.")
+
+    return p.parse_args(args)
+
+
+def main(args: List[str]) -> int:
+    do_not_track()
+
+    parsed = parse_args(args)
+    spec = ProjectSpec(models=parsed.models, depth=parsed.depth, columns=parsed.columns)
+
+    directory = parsed.project_dir or tempfile.mkdtemp(prefix="column_lineage_benchmark_")
+    directory = os.path.abspath(directory)
+    generate_project(directory, spec)
+
+    runs: List[Dict[str, Any]] = []
+
+    for threads in parsed.threads:
+        seconds = run_parse(directory, spec, threads, parsed.latency)
+        runs.append(
+            {
+                "threads": threads,
+                "seconds": seconds,
+                "models_per_second": spec.models / seconds,
+            }
+        )
+
+    report = {
+        "python": platform.python_version(),
+        "project": {
+            "directory": directory,
+            "models": spec.models,
+            "depth": spec.depth,
+            "columns": spec.columns,
+        },
+        "latency": parsed.latency,
+        "runs": runs,
+    }
+    data = json.dumps(report, indent=2)
+
+    if parsed.output:
+        with open(parsed.output, "w") as f:
+            f.write(data)
+    else:
+        print(data)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,35 @@
+"""In-process stand-in of the postgres adapter that never touches a warehouse."""
+import time
+from typing import List
+
+from dbt.adapters.factory import FACTORY
+from dbt.adapters.postgres import PostgresAdapter, PostgresColumn
+from dbt.config import RuntimeConfig
+
+
+class FakeAdapter(PostgresAdapter):
+    columns: int = 10
+    latency: float = 0.0
+
+    def set_relations_cache(self, manifest, clear: bool = False) -> None:
+        pass
+
+    def get_columns_in_relation(self, relation) -> List[PostgresColumn]:
+        # emulate a metadata query round-trip
+        if self.latency:
+            time.sleep(self.latency)
+
+        return [
+            PostgresColumn(column="col_{}".format(i), dtype="integer") for i in range(self.columns)
+        ]
+
+
+def install_fake_adapter(config: RuntimeConfig, columns: int, latency: float) -> FakeAdapter:
+    """Replace the registered adapter of `config` with a fake one."""
+    adapter = FakeAdapter(config)
+    adapter.columns = columns
+    adapter.latency = latency
+
+    FACTORY.adapters[config.credentials.type] = adapter
+
+    return adapter
@@ -0,0 +1,108 @@
+"""Generator of a dbt project with a layered DAG of models."""
+import os
+import random
+from dataclasses import dataclass
+from typing import List
+
+PROJECT_NAME = "column_lineage_benchmark"
+PROFILE_NAME = "column_lineage_benchmark"
+
+DBT_PROJECT_YML = """\
+name: {project}
+version: "1.0.0"
+config-version: 2
+profile: {profile}
+model-paths: ["models"]
+target-path: "target"
+"""
+
+# credentials are never used, the adapter is replaced with a fake one
+PROFILES_YML = """\
+{profile}:
+  target: bench
+  outputs:
+    bench:
+      type: postgres
+      host: localhost
+      port: 5432
+      user: bench
+      password: bench
+      dbname: bench
+      schema: bench
+      threads: 1
+"""
+
+
+@dataclass
+class ProjectSpec:
+    models: int
+    depth: int
+    columns: int
+    seed: int = 0
+
+
+def _model_name(layer: int, i: int) -> str:
+    return "m_{}_{}".format(layer, i)
+
+
+def _layer_sizes(spec: ProjectSpec) -> List[int]:
+    depth = max(1, min(spec.depth, spec.models))
+    base, extra = divmod(spec.models, depth)
+    return [base + (1 if layer < extra else 0) for layer in range(depth)]
+
+
+def _root_model_sql(spec: ProjectSpec) -> str:
+    targets = ", ".join("{} as col_{}".format(i, i) for i in range(spec.columns))
+    return "select {}\n".format(targets)
+
+
+def _model_sql(spec: ProjectSpec, parents: List[str]) -> str:
+    ctes = ",\n".join(
+        "p{} as (select * from {{{{ ref('{}') }}}})".format(i, parent)
+        for i, parent in enumerate(parents)
+    )
+
+    targets = []
+    for column in range(spec.columns):
+        refs = ["p{}.col_{}".format(i, column) for i in range(len(parents))]
+        targets.append("{} as col_{}".format(" + ".join(refs), column))
+
+    joins = "".join(
+        "\njoin p{} on p{}.col_0 = p0.col_0".format(i, i) for i in range(1, len(parents))
+    )
+
+    return "with {}\nselect\n    {}\nfrom p0{}\n".format(ctes, ",\n    ".join(targets), joins)
+
+
+def generate_project(directory: str, spec: ProjectSpec):
+    """Write dbt_project.yml, profiles.yml and models of the project into `directory`."""
+    rnd = random.Random(spec.seed)
+    models_dir = os.path.join(directory, "models")
+    os.makedirs(models_dir, exist_ok=True)
+
+    with open(os.path.join(directory, "dbt_project.yml"), "w") as f:
+        f.write(DBT_PROJECT_YML.format(project=PROJECT_NAME, profile=PROFILE_NAME))
+
+    with open(os.path.join(directory, "profiles.yml"), "w") as f:
+        f.write(PROFILES_YML.format(profile=PROFILE_NAME))
+
+    prev_layer: List[str] = []
+
+    for layer, size in enumerate(_layer_sizes(spec)):
+        layer_models = []
+
+        for i in range(size):
+            name = _model_name(layer, i)
+
+            if prev_layer:
+                parents = rnd.sample(prev_layer, min(2, len(prev_layer)))
+                sql = _model_sql(spec, parents)
+            else:
+                sql = _root_model_sql(spec)
+
+            with open(os.path.join(models_dir, "{}.sql".format(name)), "w") as f:
+                f.write(sql)
+
+            layer_models.append(name)
+
+        prev_layer = layer_models
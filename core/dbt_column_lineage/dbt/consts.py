@@ -1,3 +1,7 @@
 COLUMN_LINEAGE_MANIFEST_FILENAME = "manifest.json"
+COLUMN_LINEAGE_TIMINGS_FILENAME = "timings.json"
 COLUMN_LINEAGE_DOCS_FILENAME = "docs"
+COLUMN_LINEAGE_DOCS_CACHE_DIRNAME = "docs_cache"
+COLUMN_LINEAGE_EXPORT_FILENAME = "edges"
 COLUMN_LINEAGE_DIRNAME = "column_lineage"
+COLUMN_LINEAGE_GENERATOR = "dbt-column-lineage"
@@ -0,0 +1,2 @@
+class EphemeralColumnsNotFoundException(Exception):
+    pass
@@ -6,8 +6,18 @@ from dbt import flags
 from dbt.config.profile import DEFAULT_PROFILES_DIR, read_user_config
 from dbt.main import _add_selection_arguments
 from dbt.tracking import do_not_track
+from dbt_column_lineage.dbt.schemas.lineage import LineageEncoding
+from dbt_column_lineage.dbt.services.columns import ColumnResolution
+from dbt_column_lineage.dbt.services.export import EXPORTERS
+from dbt_column_lineage.dbt.tasks.diff import DiffTask
 from dbt_column_lineage.dbt.tasks.docs import DocsTask
+from dbt_column_lineage.dbt.tasks.explain import ExplainTask
+from dbt_column_lineage.dbt.tasks.export import ExportTask
+from dbt_column_lineage.dbt.tasks.impact import ImpactTask
+from dbt_column_lineage.dbt.tasks.manifest import ParseManifestColumnLineageTask
 from dbt_column_lineage.dbt.tasks.parse import ParseColumnLineageTask
+from dbt_column_lineage.dbt.tasks.serve import ServeTask
+from dbt_column_lineage.parser.backends.registry import get_backend_names
 
 
 def main(args=None):
@@ -31,6 +41,18 @@ def main(args=None):
     task.run()
 
 
+def _positive_int(value: str) -> int:
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+
+    if number < 1:
+        raise argparse.ArgumentTypeError("{} is not a positive integer".format(value))
+
+    return number
+
+
 def parse_args(args, cls=argparse.ArgumentParser):
     p = cls(
         prog="dbt-column-lineage",
@@ -74,9 +96,15 @@ def parse_args(args, cls=argparse.ArgumentParser):
 
     parse_sub = _build_parse_subparser(subs, base_subparser)
     docs_sub = _build_docs_subparser(subs, base_subparser)
+    serve_sub = _build_serve_subparser(subs, base_subparser)
+    explain_sub = _build_explain_subparser(subs, base_subparser)
+    _build_export_subparser(subs, base_subparser)
+    _build_impact_subparser(subs, base_subparser)
+    _build_diff_subparser(subs)
 
-    _add_common_arguments(parse_sub, docs_sub)
-    _add_selection_arguments(parse_sub)
+    _add_common_arguments(parse_sub, docs_sub, serve_sub, explain_sub)
+    _add_lineage_arguments(parse_sub, serve_sub, explain_sub)
+    _add_selection_arguments(parse_sub, serve_sub, explain_sub)
 
     if len(args) == 0:
         p.print_help()
@@ -84,6 +112,12 @@ def parse_args(args, cls=argparse.ArgumentParser):
 
     parsed = p.parse_args(args)
 
+    if getattr(parsed, "no_render_cache", False) and (parsed.stream or parsed.dot_only):
+        docs_sub.error("argument --no-render-cache: not allowed with --stream or --dot-only")
+
+    if getattr(parsed, "from_manifest", None) is not None:
+        parsed.cls = ParseManifestColumnLineageTask
+
     if getattr(parsed, "project_dir", None) is not None:
         expanded_user = os.path.expanduser(parsed.project_dir)
         parsed.project_dir = os.path.abspath(expanded_user)
@@ -131,6 +165,18 @@ def _build_parse_subparser(subparsers, base_subparser):
     parse_sub = subparsers.add_parser("parse", parents=[base_subparser])
     parse_sub.set_defaults(cls=ParseColumnLineageTask)
 
+    parse_sub.add_argument(
+        "--from-manifest",
+        nargs="?",
+        const="",
+        default=None,
+        metavar="PATH",
+        help="""
+        Parse lineage of nodes compiled into an existing dbt manifest without compiling
+        the project. Default path is manifest.json in the target directory.
+        """,
+    )
+
     return parse_sub
 
 
@@ -138,9 +184,185 @@ def _build_docs_subparser(subparsers, base_subparser):
     parse_sub = subparsers.add_parser("docs", parents=[base_subparser])
     parse_sub.set_defaults(cls=DocsTask)
 
+    parse_sub.add_argument(
+        "--no-render-cache",
+        action="store_true",
+        help="""
+        Lay out and render every diagram instead of reusing renders of diagrams that
+        didn't change. Not allowed with --stream and --dot-only, which never cache.
+        """,
+    )
+
+    # a streamed diagram is of the whole project and isn't cached
+    mode = parse_sub.add_mutually_exclusive_group()
+
+    mode.add_argument(
+        "--per-model",
+        action="store_true",
+        help="""
+        Draw a diagram per model with columns of models it selects from, instead of one
+        diagram of the whole project.
+        """,
+    )
+
+    mode.add_argument(
+        "--stream",
+        action="store_true",
+        help="""
+        Pipe a diagram of the whole project into dot while it's written model by model,
+        so a graph object of the project isn't built. The lineage manifest is still read
+        into memory, only models are decoded one by one. Renders aren't cached.
+        """,
+    )
+
+    mode.add_argument(
+        "--dot-only",
+        action="store_true",
+        help="""
+        Stream DOT source of the whole project to docs.gv without rendering it.
+        """,
+    )
+
     return parse_sub
 
 
+def _build_serve_subparser(subparsers, base_subparser):
+    serve_sub = subparsers.add_parser("serve", parents=[base_subparser])
+    serve_sub.set_defaults(cls=ServeTask)
+
+    serve_sub.add_argument(
+        "--host",
+        default="127.0.0.1",
+        type=str,
+        help="""
+        Host to answer lineage queries on. Default = 127.0.0.1
+        """,
+    )
+
+    serve_sub.add_argument(
+        "--port",
+        default=8581,
+        type=int,
+        help="""
+        Port to answer lineage queries on. Default = 8581
+        """,
+    )
+
+    serve_sub.add_argument(
+        "--socket",
+        default=None,
+        type=str,
+        metavar="PATH",
+        help="""
+        Answer lineage queries on a unix socket instead of host and port.
+        """,
+    )
+
+    serve_sub.add_argument(
+        "--poll-interval",
+        default=1.0,
+        type=float,
+        help="""
+        Seconds between checks of changed model, seed and schema files. Default = 1.0
+        """,
+    )
+
+    return serve_sub
+
+
+def _build_explain_subparser(subparsers, base_subparser):
+    explain_sub = subparsers.add_parser("explain", parents=[base_subparser])
+    explain_sub.set_defaults(cls=ExplainTask)
+
+    explain_sub.add_argument(
+        "--columns",
+        nargs="+",
+        required=True,
+        metavar="COLUMN",
+        help="""
+        Columns of selected models to print lineage of. Only fields they depend on
+        are resolved.
+        """,
+    )
+
+    return explain_sub
+
+
+def _build_export_subparser(subparsers, base_subparser):
+    export_sub = subparsers.add_parser("export", parents=[base_subparser])
+    export_sub.set_defaults(cls=ExportTask)
+
+    export_sub.add_argument(
+        "--format",
+        choices=list(EXPORTERS),
+        default="csv",
+        help="""
+        Format of column edges: CSV or Parquet edge list, or GraphML graph. Default = csv
+        """,
+    )
+
+    export_sub.add_argument(
+        "--output",
+        default=None,
+        type=str,
+        metavar="PATH",
+        help="""
+        Path to write edges to. Default is edges.<format> in the column lineage directory.
+        """,
+    )
+
+    export_sub.add_argument(
+        "--chunk-size",
+        default=10000,
+        type=_positive_int,
+        help="""
+        Number of edges, or of nodes and edges of GraphML, written at once. Chunks bound
+        memory of output only, the lineage manifest is still read into memory and models
+        are decoded one by one. Default = 10000
+        """,
+    )
+
+    return export_sub
+
+
+def _build_impact_subparser(subparsers, base_subparser):
+    impact_sub = subparsers.add_parser("impact", parents=[base_subparser])
+    impact_sub.set_defaults(cls=ImpactTask)
+
+    impact_sub.add_argument(
+        "columns",
+        nargs="+",
+        type=str,
+        metavar="UNIQUE_ID.COLUMN",
+        help="""
+        Columns to print origins of, and columns, models and exposures depending on them,
+        e.g. model.jaffle_shop.customers.email
+        """,
+    )
+
+    return impact_sub
+
+
+def _build_diff_subparser(subparsers):
+    diff_sub = subparsers.add_parser("diff")
+    diff_sub.set_defaults(cls=DiffTask)
+
+    diff_sub.add_argument("old", type=str, help="Path to a previous lineage manifest.")
+    diff_sub.add_argument("new", type=str, help="Path to a current lineage manifest.")
+
+    diff_sub.add_argument(
+        "--output",
+        default=None,
+        type=str,
+        metavar="PATH",
+        help="""
+        Write changes as JSON lines to a file instead of stdout.
+        """,
+    )
+
+    return diff_sub
+
+
 def _add_common_arguments(*subparsers):
     for sub in subparsers:
         sub.add_argument(
@@ -152,3 +374,114 @@ def _add_common_arguments(*subparsers):
             settings in profiles.yml.
             """,
         )
+
+
+def _add_lineage_arguments(*subparsers):
+    for sub in subparsers:
+        sub.add_argument(
+            "--introspection-threads",
+            default=None,
+            type=int,
+            help="""
+            Number of concurrent queries of relation columns. Default is number of threads.
+            """,
+        )
+
+        sub.add_argument(
+            "--column-resolution",
+            nargs="+",
+            choices=[resolution.value for resolution in ColumnResolution],
+            default=[ColumnResolution.WAREHOUSE.value],
+            help="""
+            Where to get columns of models without model dependencies and of models selected
+            from, the first one which knows columns of a model wins: columns declared in
+            schema yaml files, catalog.json of dbt docs generate or the warehouse. Seed columns
+            are always read from seed files. Default = warehouse
+            """,
+        )
+
+        sub.add_argument(
+            "--catalog",
+            default=None,
+            type=str,
+            metavar="PATH",
+            help="""
+            Path to a catalog for the catalog column resolution. Default is catalog.json in
+            the target directory.
+            """,
+        )
+
+        sub.add_argument(
+            "--parser-backend",
+            choices=list(get_backend_names()),
+            default=None,
+            help="""
+            Which SQL parser to use. Default is chosen by adapter type.
+            """,
+        )
+
+        sub.add_argument(
+            "--max-formula-length",
+            default=None,
+            type=int,
+            help="""
+            Truncate formulas of columns longer than specified number of characters.
+            """,
+        )
+
+        sub.add_argument(
+            "--node-time-budget",
+            default=None,
+            type=float,
+            metavar="SECONDS",
+            help="""
+            Skip lineage of a model if it isn't parsed within specified number of seconds.
+            """,
+        )
+
+        sub.add_argument(
+            "--node-sql-size-budget",
+            default=None,
+            type=int,
+            metavar="CHARS",
+            help="""
+            Skip lineage of a model if its compiled SQL is longer than specified number of
+            characters, memory of parsing is proportional to it.
+            """,
+        )
+
+        sub.add_argument(
+            "--no-template-cache",
+            action="store_true",
+            help="""
+            Resolve every model from scratch instead of reusing lineage of models with SQL
+            differing only in names of relations and string literals.
+            """,
+        )
+
+        sub.add_argument(
+            "--manifest-encoding",
+            choices=[encoding.value for encoding in LineageEncoding],
+            default=LineageEncoding.NESTED.value,
+            help="""
+            How to write the lineage manifest: nested objects or a string table of model and
+            column names referred by index. Both are read transparently. Default = nested
+            """,
+        )
+
+        sub.add_argument(
+            "--log-timings",
+            action="store_true",
+            help="""
+            Log a summary of time spent in every stage of lineage parsing.
+            """,
+        )
+
+        sub.add_argument(
+            "--timings-slowest",
+            default=10,
+            type=int,
+            help="""
+            Number of the slowest models to report in timings. Default = 10
+            """,
+        )
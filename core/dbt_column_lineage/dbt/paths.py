@@ -3,7 +3,10 @@ import os
 from dbt.config import RuntimeConfig
 from dbt_column_lineage.dbt.consts import (
     COLUMN_LINEAGE_DIRNAME,
+    COLUMN_LINEAGE_DOCS_CACHE_DIRNAME,
+    COLUMN_LINEAGE_EXPORT_FILENAME,
     COLUMN_LINEAGE_MANIFEST_FILENAME,
+    COLUMN_LINEAGE_TIMINGS_FILENAME,
 )
 
 
@@ -17,3 +20,18 @@ def get_column_lineage_directory(config: RuntimeConfig) -> str:
 def get_column_lineage_manifest_path(config: RuntimeConfig) -> str:
     directory = get_column_lineage_directory(config)
     return os.path.join(directory, COLUMN_LINEAGE_MANIFEST_FILENAME)
+
+
+def get_column_lineage_timings_path(config: RuntimeConfig) -> str:
+    directory = get_column_lineage_directory(config)
+    return os.path.join(directory, COLUMN_LINEAGE_TIMINGS_FILENAME)
+
+
+def get_column_lineage_export_path(config: RuntimeConfig, extension: str) -> str:
+    directory = get_column_lineage_directory(config)
+    return os.path.join(directory, "{}.{}".format(COLUMN_LINEAGE_EXPORT_FILENAME, extension))
+
+
+def get_column_lineage_docs_cache_directory(config: RuntimeConfig) -> str:
+    directory = get_column_lineage_directory(config)
+    return os.path.join(directory, COLUMN_LINEAGE_DOCS_CACHE_DIRNAME)
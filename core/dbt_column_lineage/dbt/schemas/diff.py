@@ -0,0 +1,30 @@
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+from dbt.dataclass_schema import StrEnum
+from dbt_column_lineage.dbt.schemas.base import dbtIntegrationMixin
+
+
+class ChangeStatus(StrEnum):
+    ADDED = "added"
+    REMOVED = "removed"
+    CHANGED = "changed"
+
+
+@dataclass
+class SourceEdge(dbtIntegrationMixin):
+    name: str
+    column: str
+
+
+@dataclass
+class LineageChange(dbtIntegrationMixin):
+    """Change of a model, or of its column if `column` is set."""
+
+    model: str
+    status: ChangeStatus
+    column: Optional[str] = None
+    old_formula: Optional[str] = None
+    new_formula: Optional[str] = None
+    added_sources: List[SourceEdge] = field(default_factory=list)
+    removed_sources: List[SourceEdge] = field(default_factory=list)
@@ -1,7 +1,10 @@
 from dataclasses import dataclass, field
-from typing import List
+from functools import partial
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Optional
 
-from dbt.clients.system import write_json
+from dbt.clients.system import read_json, write_json
+from dbt.dataclass_schema import StrEnum
+from dbt_column_lineage.dbt.consts import COLUMN_LINEAGE_GENERATOR
 from dbt_column_lineage.dbt.schemas.base import dbtIntegrationMixin
 
 
@@ -25,12 +28,189 @@ ColumnsLineage = List[ColumnLineage]
 class ModelColumnsLineage(dbtIntegrationMixin):
     name: str
     columns: ColumnsLineage
+    # set if lineage wasn't parsed, e.g. a model is out of budget
+    skipped_reason: Optional[str] = None
+
+
+class LineageEncoding(StrEnum):
+    # models and columns are nested objects
+    NESTED = "nested"
+    # names of models and columns are stored once and referred by index
+    DICTIONARY = "dictionary"
+
+
+@dataclass
+class LineageMetadata(dbtIntegrationMixin):
+    generator: str = COLUMN_LINEAGE_GENERATOR
+    encoding: LineageEncoding = LineageEncoding.NESTED
 
 
 @dataclass
 class ModelsColumnsLineage(dbtIntegrationMixin):
     models: List[ModelColumnsLineage]
+    metadata: LineageMetadata = field(default_factory=LineageMetadata)
+
+    def write(self, path: str, encoding: LineageEncoding = LineageEncoding.NESTED):
+        if encoding == LineageEncoding.DICTIONARY:
+            data = _encode_models_columns_lineage(self)
+        else:
+            data = self.to_dict()
 
-    def write(self, path: str):
-        data = self.to_dict()
         write_json(path, data)
+
+
+class _StringTable:
+    def __init__(self):
+        self.strings: List[str] = []
+        self._ids: Dict[str, int] = {}
+
+    def get_id(self, string: str) -> int:
+        id_ = self._ids.get(string)
+
+        if id_ is None:
+            id_ = len(self.strings)
+            self._ids[string] = id_
+            self.strings.append(string)
+
+        return id_
+
+
+def _encode_models_columns_lineage(lineage: ModelsColumnsLineage) -> Dict[str, Any]:
+    # model: [name, [column, ...]] or [name, [column, ...], skipped reason]
+    # column: [name, formula, [source, ...]]
+    # source: [name, [column name, ...]]
+    table = _StringTable()
+    get_id = table.get_id
+
+    models = [
+        [
+            get_id(model.name),
+            [
+                [
+                    get_id(column.name),
+                    column.formula,
+                    [
+                        [get_id(source.name), [get_id(name) for name in source.columns]]
+                        for source in column.sources
+                    ],
+                ]
+                for column in model.columns
+            ],
+        ]
+        for model in lineage.models
+    ]
+
+    for record, model in zip(models, lineage.models):
+        if model.skipped_reason is not None:
+            record.append(model.skipped_reason)
+
+    metadata = LineageMetadata(
+        generator=lineage.metadata.generator,
+        encoding=LineageEncoding.DICTIONARY,
+    )
+
+    return {"metadata": metadata.to_dict(), "strings": table.strings, "models": models}
+
+
+def _decode_dictionary_model_columns_lineage(
+    strings: List[str], data: List[Any]
+) -> ModelColumnsLineage:
+    name_id, columns, *skipped_reason = data
+
+    return ModelColumnsLineage(
+        name=strings[name_id],
+        columns=[
+            ColumnLineage(
+                name=strings[column_name_id],
+                formula=formula,
+                sources=[
+                    Source(
+                        name=strings[source_name_id],
+                        columns=[strings[id_] for id_ in column_ids],
+                    )
+                    for source_name_id, column_ids in sources
+                ],
+            )
+            for column_name_id, formula, sources in columns
+        ],
+        skipped_reason=skipped_reason[0] if skipped_reason else None,
+    )
+
+
+def _decode_model_columns_lineage(data: Dict[str, Any]) -> ModelColumnsLineage:
+    # build dataclasses as is, data was written by this tool
+    return ModelColumnsLineage(
+        name=data["name"],
+        columns=[
+            ColumnLineage(
+                name=column["name"],
+                formula=column.get("formula", ""),
+                sources=[
+                    Source(name=source["name"], columns=source["columns"])
+                    for source in column.get("sources", ())
+                ],
+            )
+            for column in data["columns"]
+        ],
+        skipped_reason=data.get("skipped_reason"),
+    )
+
+
+class LazyModelsColumnsLineage(Mapping[str, ModelColumnsLineage]):
+    """Models columns lineage keyed by model unique_id, each model is decoded on first access."""
+
+    def __init__(self, data: Dict[str, Any]):
+        metadata = data.get("metadata") or {}
+        trusted = metadata.get("generator") == COLUMN_LINEAGE_GENERATOR
+        self.encoding = LineageEncoding(metadata.get("encoding", LineageEncoding.NESTED))
+
+        self._decode: Callable[[Any], ModelColumnsLineage]
+
+        if self.encoding == LineageEncoding.DICTIONARY:
+            strings = data["strings"]
+            self._decode = partial(_decode_dictionary_model_columns_lineage, strings)
+            self._records: Dict[str, Any] = {
+                strings[record[0]]: record for record in data["models"]
+            }
+        else:
+            self._decode = (
+                _decode_model_columns_lineage if trusted else ModelColumnsLineage.from_dict
+            )
+            self._records = {record["name"]: record for record in data["models"]}
+
+        self._decoded: Dict[str, ModelColumnsLineage] = {}
+
+    @classmethod
+    def read(cls, path: str) -> "LazyModelsColumnsLineage":
+        return cls(read_json(path))
+
+    @property
+    def models(self) -> List[ModelColumnsLineage]:
+        return list(self.values())
+
+    def get_record(self, unique_id: str) -> Any:
+        """Return a model as stored in a file, without decoding."""
+        return self._records[unique_id]
+
+    def decode(self, unique_id: str) -> ModelColumnsLineage:
+        # decode without keeping a decoded model in memory
+        return self._decoded.get(unique_id) or self._decode(self._records[unique_id])
+
+    def iter_models(self) -> Iterator[ModelColumnsLineage]:
+        for unique_id in self._records:
+            yield self.decode(unique_id)
+
+    def __getitem__(self, unique_id: str) -> ModelColumnsLineage:
+        model = self._decoded.get(unique_id)
+
+        if model is None:
+            model = self._decode(self._records[unique_id])
+            self._decoded[unique_id] = model
+
+        return model
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._records)
+
+    def __len__(self) -> int:
+        return len(self._records)
@@ -0,0 +1,204 @@
+from collections import deque
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Set
+
+from dbt_column_lineage.dbt.schemas.lineage import ModelColumnsLineage
+from dbt_column_lineage.dbt.services.index import ColumnKey, iter_column_sources
+
+# closures of single columns kept for reuse by next queries
+CLOSURE_CACHE_SIZE = 4096
+
+
+def _reverse(edges: Sequence[Sequence[int]]) -> List[List[int]]:
+    reversed_edges: List[List[int]] = [[] for _ in edges]
+
+    for i, sources in enumerate(edges):
+        for j in sources:
+            reversed_edges[j].append(i)
+
+    return reversed_edges
+
+
+def _sort(edges: Sequence[Sequence[int]]) -> List[int]:
+    # columns go after their sources
+    in_degrees = [len(sources) for sources in edges]
+    dependents = _reverse(edges)
+    queue = deque(i for i, in_degree in enumerate(in_degrees) if in_degree == 0)
+    order = []
+
+    while queue:
+        i = queue.popleft()
+        order.append(i)
+
+        for j in dependents[i]:
+            in_degrees[j] -= 1
+            if in_degrees[j] == 0:
+                queue.append(j)
+
+    if len(order) != len(edges):
+        raise ValueError("Columns lineage has a cycle.")
+
+    return order
+
+
+class _ClosureCache:
+    """Closures of single columns, the oldest one is dropped when the cache is full."""
+
+    def __init__(self, size: int):
+        self.size = size
+        self._closures: Dict[int, Set[int]] = {}
+
+    def get(self, i: int) -> Optional[Set[int]]:
+        return self._closures.get(i)
+
+    def add(self, i: int, closure: Set[int]):
+        if len(self._closures) >= self.size:
+            del self._closures[next(iter(self._closures))]
+
+        self._closures[i] = closure
+
+
+def _close(starts: Iterable[int], edges: Sequence[Sequence[int]], cache: _ClosureCache) -> Set[int]:
+    # a cached closure of a reached column is taken whole instead of traversing it again
+    closure: Set[int] = set()
+    stack = list(starts)
+
+    while stack:
+        for j in edges[stack.pop()]:
+            if j in closure:
+                continue
+
+            closure.add(j)
+            cached = cache.get(j)
+
+            if cached is None:
+                stack.append(j)
+            else:
+                closure |= cached
+
+    return closure
+
+
+class ColumnClosure:
+    """Transitive closure of columns lineage of a whole project, computed on demand.
+
+    Columns are indexed by integers in topological order and only their adjacency is stored,
+    so memory is linear in edges. Closures of any number of columns are found by one
+    traversal, closures of single columns are cached and reused by next traversals.
+    Exposures are related to columns by models they depend on.
+    """
+
+    def __init__(
+        self,
+        columns: Sequence[ColumnKey],
+        sources: Sequence[Sequence[int]],
+        exposures: Optional[Mapping[str, Iterable[str]]] = None,
+        cache_size: int = CLOSURE_CACHE_SIZE,
+    ):
+        order = _sort(sources)
+        position = {i: p for p, i in enumerate(order)}
+
+        self.columns: List[ColumnKey] = [columns[i] for i in order]
+        self.index: Dict[ColumnKey, int] = {key: p for p, key in enumerate(self.columns)}
+        self.sources = [[position[j] for j in sources[i]] for i in order]
+        self.dependents = _reverse(self.sources)
+        self.exposures = {name: set(models) for name, models in (exposures or {}).items()}
+
+        self._upstream_cache = _ClosureCache(cache_size)
+        self._downstream_cache = _ClosureCache(cache_size)
+        self._folded_index: Optional[Dict[ColumnKey, List[ColumnKey]]] = None
+
+    @classmethod
+    def from_models(
+        cls,
+        models: Iterable[ModelColumnsLineage],
+        exposures: Optional[Mapping[str, Iterable[str]]] = None,
+    ) -> "ColumnClosure":
+        index: Dict[ColumnKey, int] = {}
+        sources: List[List[int]] = []
+
+        def get_idx(key: ColumnKey) -> int:
+            idx = index.get(key)
+
+            if idx is None:
+                idx = index[key] = len(sources)
+                sources.append([])
+
+            return idx
+
+        for model in models:
+            for column in model.columns:
+                idx = get_idx((model.name, column.name))
+                sources[idx].extend(map(get_idx, iter_column_sources(column)))
+
+        return cls(list(index), sources, exposures)
+
+    def find(self, key: ColumnKey) -> Optional[ColumnKey]:
+        """Find a column by its exact name, or else by its name in any case if it's unique.
+
+        Warehouses fold unquoted names differently, e.g. columns of seeds are upper case
+        on Snowflake, while names in compiled SQL are lower case.
+        """
+        if key in self.index:
+            return key
+
+        if self._folded_index is None:
+            self._folded_index = {}
+
+            for name, column in self.columns:
+                self._folded_index.setdefault((name, column.lower()), []).append((name, column))
+
+        found = self._folded_index.get((key[0], key[1].lower()), [])
+
+        return found[0] if len(found) == 1 else None
+
+    def to_indexes(self, keys: Iterable[ColumnKey]) -> List[int]:
+        return [self.index[key] for key in keys]
+
+    def to_keys(self, indexes: Iterable[int]) -> List[ColumnKey]:
+        # sorted indexes are in lineage order
+        return [self.columns[i] for i in sorted(indexes)]
+
+    def _get_closure(
+        self, keys: Iterable[ColumnKey], edges: Sequence[Sequence[int]], cache: _ClosureCache
+    ) -> Set[int]:
+        indexes = self.to_indexes(keys)
+
+        if len(indexes) != 1:
+            return _close(indexes, edges, cache)
+
+        closure = cache.get(indexes[0])
+
+        if closure is None:
+            closure = _close(indexes, edges, cache)
+            cache.add(indexes[0], closure)
+
+        return closure
+
+    def _get_upstream(self, keys: Iterable[ColumnKey]) -> Set[int]:
+        return self._get_closure(keys, self.sources, self._upstream_cache)
+
+    def _get_downstream(self, keys: Iterable[ColumnKey]) -> Set[int]:
+        return self._get_closure(keys, self.dependents, self._downstream_cache)
+
+    def get_upstream(self, key: ColumnKey) -> List[ColumnKey]:
+        return self.to_keys(self._get_upstream([key]))
+
+    def get_origins(self, keys: Iterable[ColumnKey]) -> List[ColumnKey]:
+        """Return ultimate sources of columns, i.e. upstream columns without sources."""
+        return self.to_keys(i for i in self._get_upstream(keys) if not self.sources[i])
+
+    def get_downstream(self, key: ColumnKey) -> List[ColumnKey]:
+        return self.to_keys(self._get_downstream([key]))
+
+    def get_affected(self, keys: Iterable[ColumnKey]) -> List[ColumnKey]:
+        """Return columns depending on any of columns, e.g. on PII ones."""
+        return self.to_keys(self._get_downstream(keys))
+
+    def get_affected_models(self, keys: Iterable[ColumnKey]) -> Set[str]:
+        return {name for name, _ in self.get_affected(keys)}
+
+    def get_affected_exposures(self, keys: Iterable[ColumnKey]) -> Set[str]:
+        """Return exposures depending on models of columns or on models affected by them."""
+        keys = list(keys)
+        models = {name for name, _ in keys} | self.get_affected_models(keys)
+        return {name for name, depends_on in self.exposures.items() if depends_on & models}
@@ -0,0 +1,168 @@
+import os
+import threading
+from concurrent.futures import Future
+from operator import itemgetter
+from typing import Callable, Dict, Iterable, Optional, Sequence, Tuple, Union
+
+from dbt.clients.system import read_json
+from dbt.contracts.graph.compiled import CompiledModelNode, CompiledSeedNode
+from dbt.contracts.graph.manifest import Manifest
+from dbt.dataclass_schema import StrEnum
+from dbt.node_types import NodeType
+from dbt_column_lineage.dbt.schemas.lineage import ColumnsLineage
+from dbt_column_lineage.dbt.services.introspection import RelationIntrospector
+from dbt_column_lineage.dbt.services.seeds import get_seed_columns
+from dbt_column_lineage.parser.exceptions import BudgetExceededException
+
+Columns = Tuple[str, ...]
+
+
+class ColumnResolution(StrEnum):
+    # columns declared in schema yaml files
+    DECLARED = "declared"
+    # columns of catalog.json written by dbt docs generate
+    CATALOG = "catalog"
+    # columns queried from relations
+    WAREHOUSE = "warehouse"
+
+
+def get_declared_columns_index(manifest: Manifest) -> Dict[str, Columns]:
+    return {
+        unique_id: tuple(node.columns)
+        for unique_id, node in manifest.nodes.items()
+        if getattr(node, "columns", None)
+    }
+
+
+def read_catalog_columns_index(path: str) -> Dict[str, Columns]:
+    if not os.path.exists(path):
+        return {}
+
+    catalog = read_json(path)
+    index = {}
+
+    for unique_id, table in catalog.get("nodes", {}).items():
+        columns = sorted(table["columns"].values(), key=itemgetter("index"))
+        index[unique_id] = tuple(map(itemgetter("name"), columns))
+
+    return index
+
+
+class EphemeralLineageCache:
+    """Lineage of ephemeral models, each is resolved once per run and shared by models
+    inlining it, while other threads wait for a model being resolved.
+
+    A model out of its budget isn't cached, so it's resolved again by its next consumer.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._futures: Dict[str, Future] = {}
+
+    def _get_future(self, unique_id: str) -> Tuple[Future, bool]:
+        with self._lock:
+            future = self._futures.get(unique_id)
+            is_owner = future is None
+
+            if is_owner:
+                future = self._futures[unique_id] = Future()
+
+        return future, is_owner
+
+    def _resolve(
+        self, unique_id: str, future: Future, resolve: Callable[[], ColumnsLineage]
+    ) -> ColumnsLineage:
+        try:
+            future.set_result(resolve())
+        except BudgetExceededException as e:
+            # a time budget depends on load of a run, so waiting threads resolve it themselves
+            with self._lock:
+                del self._futures[unique_id]
+            future.set_exception(e)
+        except Exception as e:
+            future.set_exception(e)
+
+        return future.result()
+
+    def get(self, unique_id: str, resolve: Callable[[], ColumnsLineage]) -> ColumnsLineage:
+        while True:
+            future, is_owner = self._get_future(unique_id)
+
+            if is_owner:
+                return self._resolve(unique_id, future, resolve)
+
+            try:
+                return future.result()
+            except BudgetExceededException:
+                continue
+
+
+class ColumnsLookup:
+    """Columns of nodes by the first resolution in order which knows them.
+
+    Seeds are read from their files ahead of any resolution, unless the adapter folds their
+    unquoted names unknown way. Declared and catalog columns
+    are indexed once per run, so they are answered in memory, and the warehouse is queried
+    by the introspector only for the rest. Columns of ephemeral models are known
+    from their lineage.
+    """
+
+    def __init__(
+        self,
+        introspector: RelationIntrospector,
+        resolutions: Sequence[ColumnResolution],
+        declared: Dict[str, Columns],
+        catalog: Dict[str, Columns],
+    ):
+        self.introspector = introspector
+        self.resolutions = list(resolutions)
+        self._indexes = {
+            ColumnResolution.DECLARED: declared,
+            ColumnResolution.CATALOG: catalog,
+        }
+        self.ephemerals = EphemeralLineageCache()
+
+    @classmethod
+    def from_manifest(
+        cls,
+        introspector: RelationIntrospector,
+        manifest: Manifest,
+        resolutions: Iterable[ColumnResolution],
+        catalog_path: str,
+    ) -> "ColumnsLookup":
+        resolutions = list(resolutions)
+        declared = (
+            get_declared_columns_index(manifest) if ColumnResolution.DECLARED in resolutions else {}
+        )
+        catalog = (
+            read_catalog_columns_index(catalog_path)
+            if ColumnResolution.CATALOG in resolutions
+            else {}
+        )
+
+        return cls(introspector, resolutions, declared, catalog)
+
+    @property
+    def uses_warehouse(self) -> bool:
+        return ColumnResolution.WAREHOUSE in self.resolutions
+
+    def get_local_columns(
+        self, node: Union[CompiledModelNode, CompiledSeedNode]
+    ) -> Optional[Columns]:
+        """Get columns known without the warehouse, None if the warehouse must be queried."""
+        if node.resource_type == NodeType.Seed:
+            columns = get_seed_columns(node, self.introspector.adapter)
+
+            if columns is not None:
+                return columns
+
+        for resolution in self.resolutions:
+            if resolution == ColumnResolution.WAREHOUSE:
+                return None
+
+            columns = self._indexes[resolution].get(node.unique_id)
+
+            if columns:
+                return columns
+
+        return None
@@ -0,0 +1,89 @@
+from typing import AbstractSet, Iterator, List, Optional, Tuple
+
+from dbt_column_lineage.dbt.schemas.diff import ChangeStatus, LineageChange, SourceEdge
+from dbt_column_lineage.dbt.schemas.lineage import (
+    ColumnLineage,
+    LazyModelsColumnsLineage,
+    LineageEncoding,
+    ModelColumnsLineage,
+)
+
+SourceKey = Tuple[str, str]
+
+
+def _get_sources(column: ColumnLineage) -> AbstractSet[SourceKey]:
+    return {(source.name, name) for source in column.sources for name in source.columns}
+
+
+def _to_edges(sources: AbstractSet[SourceKey]) -> List[SourceEdge]:
+    return [SourceEdge(name=name, column=column) for name, column in sorted(sources)]
+
+
+def diff_column(model: str, old: ColumnLineage, new: ColumnLineage) -> Optional[LineageChange]:
+    old_sources = _get_sources(old)
+    new_sources = _get_sources(new)
+    is_formula_changed = old.formula != new.formula
+
+    if not is_formula_changed and old_sources == new_sources:
+        return None
+
+    change = LineageChange(
+        model=model,
+        status=ChangeStatus.CHANGED,
+        column=new.name,
+        added_sources=_to_edges(new_sources - old_sources),
+        removed_sources=_to_edges(old_sources - new_sources),
+    )
+
+    if is_formula_changed:
+        change.old_formula = old.formula
+        change.new_formula = new.formula
+
+    return change
+
+
+def diff_model(old: ModelColumnsLineage, new: ModelColumnsLineage) -> Iterator[LineageChange]:
+    # columns are merged by name instead of scanning columns of one model for each other
+    old_columns = {column.name: column for column in old.columns}
+    new_columns = {column.name: column for column in new.columns}
+
+    for name, old_column in old_columns.items():
+        new_column = new_columns.get(name)
+
+        if new_column is None:
+            yield LineageChange(model=new.name, status=ChangeStatus.REMOVED, column=name)
+            continue
+
+        change = diff_column(new.name, old_column, new_column)
+        if change:
+            yield change
+
+    for name in new_columns:
+        if name not in old_columns:
+            yield LineageChange(model=new.name, status=ChangeStatus.ADDED, column=name)
+
+
+def _is_unchanged(
+    old: LazyModelsColumnsLineage, new: LazyModelsColumnsLineage, unique_id: str
+) -> bool:
+    # nested records are compared as read without decoding, while ids of dictionary
+    # encoded records refer to string tables of their own files
+    if old.encoding == new.encoding == LineageEncoding.NESTED:
+        return old.get_record(unique_id) == new.get_record(unique_id)
+
+    return old.decode(unique_id) == new.decode(unique_id)
+
+
+def diff_lineage(
+    old: LazyModelsColumnsLineage, new: LazyModelsColumnsLineage
+) -> Iterator[LineageChange]:
+    """Stream changes of models merged by unique_id, only changed models are decoded."""
+    for unique_id in old:
+        if unique_id not in new:
+            yield LineageChange(model=unique_id, status=ChangeStatus.REMOVED)
+        elif not _is_unchanged(old, new, unique_id):
+            yield from diff_model(old.decode(unique_id), new.decode(unique_id))
+
+    for unique_id in new:
+        if unique_id not in old:
+            yield LineageChange(model=unique_id, status=ChangeStatus.ADDED)
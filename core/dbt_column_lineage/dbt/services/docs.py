@@ -1,9 +1,23 @@
+import hashlib
+import os
+import shutil
+import subprocess
 from itertools import count
-from operator import attrgetter
-from typing import Dict, Iterator
+from typing import IO, Dict, Iterable, Iterator, Optional, Sequence, Set, Tuple
 
-from dbt_column_lineage.dbt.schemas.lineage import ColumnLineage, ModelsColumnsLineage
+from dbt.exceptions import RuntimeException
+from dbt_column_lineage.dbt.schemas.lineage import (
+    ColumnLineage,
+    ModelColumnsLineage,
+    ModelsColumnsLineage,
+)
 from graphviz import Digraph
+from graphviz.quoting import attr_list, quote
+
+GRAPH_ATTR = {"rankdir": "LR", "ranksep": "3", "ratio": "auto"}
+EDGE_ATTR = {"arrowtail": "dot", "arrowsize": "0.5"}
+CLUSTER_ATTR = {"rank": "same", "color": "black", "fontname": "times bold"}
+COLUMN_NODE_ATTR = {"style": "filled", "color": "lightgrey"}
 
 
 def _has_many_columns(column_lineage: ColumnLineage) -> bool:
@@ -20,48 +34,59 @@ def _has_many_columns(column_lineage: ColumnLineage) -> bool:
 def _setup_graph() -> Digraph:
     g = Digraph("G")
 
-    g.graph_attr["rankdir"] = "LR"
-    g.graph_attr["ranksep"] = "3"
-    g.graph_attr["ratio"] = "auto"
-    g.edge_attr["arrowtail"] = "dot"
-    g.edge_attr["arrowsize"] = "0.5"
+    g.graph_attr.update(GRAPH_ATTR)
+    g.edge_attr.update(EDGE_ATTR)
 
     return g
 
 
+def _iter_source_columns(model_columns_lineage: ModelColumnsLineage) -> Iterator[Tuple[str, str]]:
+    for column_lineage in model_columns_lineage.columns:
+        for source in column_lineage.sources:
+            for column in source.columns:
+                yield source.name, column
+
+
+def _add_source_columns(
+    model_column_index_map: Dict[str, Dict[str, str]],
+    model_columns_lineage: ModelColumnsLineage,
+    index: Iterator[str],
+):
+    for model_name, column in _iter_source_columns(model_columns_lineage):
+        column_index_map = model_column_index_map.setdefault(model_name, {})
+
+        if column not in column_index_map:
+            column_index_map[column] = next(index)
+
+
 def _get_model_column_index_map(
     models_columns_lineage: ModelsColumnsLineage,
     index: Iterator[str],
 ) -> Dict[str, Dict[str, str]]:
-    return {
+    model_column_index_map = {
         model_columns_lineage.name: {
             column.name: next(index) for column in model_columns_lineage.columns
         }
         for model_columns_lineage in models_columns_lineage.models
     }
 
-
-def _init_clusters(
-    g: Digraph,
-    models_columns_lineage: ModelsColumnsLineage,
-    model_column_index_map: Dict[str, Dict[str, str]],
-):
+    # columns of sources without lineage, e.g. skipped by a budget, are drawn as referenced
     for model_columns_lineage in models_columns_lineage.models:
-        model_name = model_columns_lineage.name
-        columns_lineage = model_columns_lineage.columns
+        _add_source_columns(model_column_index_map, model_columns_lineage, index)
+
+    return model_column_index_map
 
-        column_names = map(attrgetter("name"), columns_lineage)
-        column_index_map = model_column_index_map[model_name]
 
+def _init_clusters(g: Digraph, model_column_index_map: Dict[str, Dict[str, str]]):
+    for model_name, column_index_map in model_column_index_map.items():
         with g.subgraph(name="cluster_{}".format(model_name)) as c:
-            c.attr(rank="same")
-            c.attr(color="black")
-            c.node_attr.update(style="filled", color="lightgrey")
+            c.attr(**CLUSTER_ATTR)
+            c.node_attr.update(COLUMN_NODE_ATTR)
 
-            for column_name in column_names:
-                c.node(name=column_index_map[column_name], label=column_name)
+            for column_name, node in column_index_map.items():
+                c.node(name=node, label=column_name)
 
-            c.attr(label=model_name, fontname="times bold")
+            c.attr(label=model_name)
 
 
 def _init_edges(
@@ -103,17 +128,195 @@ def _init_edges(
                 g.edge(intermediate_node, current_node, dir="none", label=formula)
 
 
+class RenderCache:
+    """Rendered diagrams by a hash of their DOT source, which holds nodes, edges and labels.
+
+    A diagram is laid out again only if its source changed since a previous render.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self.used: Set[str] = set()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, g: Digraph, filename: str, directory: str):
+        key = hashlib.sha256("{}\n{}".format(g.format, g.source).encode()).hexdigest()
+        cached_filename = "{}.{}".format(key, g.format)
+        cached_path = os.path.join(self.directory, cached_filename)
+
+        if os.path.exists(cached_path):
+            self.hits += 1
+        else:
+            self.misses += 1
+            g.render(key, self.directory, cleanup=True)
+
+        self.used.add(cached_filename)
+
+        os.makedirs(directory, exist_ok=True)
+        shutil.copyfile(cached_path, os.path.join(directory, "{}.{}".format(filename, g.format)))
+
+    def prune(self):
+        """Remove renders not used since the cache was created."""
+        if not os.path.isdir(self.directory):
+            return
+
+        for filename in os.listdir(self.directory):
+            if filename not in self.used:
+                os.remove(os.path.join(self.directory, filename))
+
+
+def _build_graph(models_columns_lineage: ModelsColumnsLineage) -> Digraph:
+    g = _setup_graph()
+
+    index = map(str, count(1, 1))
+    model_column_index_map = _get_model_column_index_map(models_columns_lineage, index)
+
+    _init_clusters(g, model_column_index_map)
+    _init_edges(g, models_columns_lineage, model_column_index_map, index)
+
+    return g
+
+
+def _render(g: Digraph, filename: str, directory: str, cache: Optional[RenderCache]):
+    if cache is None:
+        g.render(filename, directory, cleanup=True)
+    else:
+        cache.render(g, filename, directory)
+
+
+def _get_model_neighbourhood(model_columns_lineage: ModelColumnsLineage) -> ModelsColumnsLineage:
+    # sources are drawn with referenced columns only and without their own lineage
+    source_columns: Dict[str, Dict[str, None]] = {}
+
+    for column_lineage in model_columns_lineage.columns:
+        for source in column_lineage.sources:
+            source_columns.setdefault(source.name, {}).update(dict.fromkeys(source.columns))
+
+    sources = [
+        ModelColumnsLineage(name=name, columns=[ColumnLineage(name=column) for column in columns])
+        for name, columns in source_columns.items()
+    ]
+
+    return ModelsColumnsLineage(models=[*sources, model_columns_lineage])
+
+
 def draw_lineage(
     models_columns_lineage: ModelsColumnsLineage,
     filename: str,
     directory: str,
+    cache: Optional[RenderCache] = None,
 ):
-    g = _setup_graph()
+    g = _build_graph(models_columns_lineage)
+    _render(g, filename, directory, cache)
 
-    index = map(str, count(1, 1))
-    model_column_index_map = _get_model_column_index_map(models_columns_lineage, index)
 
-    _init_clusters(g, models_columns_lineage, model_column_index_map)
-    _init_edges(g, models_columns_lineage, model_column_index_map, index)
+def draw_models_lineage(
+    models: Iterable[ModelColumnsLineage],
+    directory: str,
+    cache: Optional[RenderCache] = None,
+):
+    """Draw a diagram per model with columns of models it selects from."""
+    for model_columns_lineage in models:
+        g = _build_graph(_get_model_neighbourhood(model_columns_lineage))
+        _render(g, model_columns_lineage.name, directory, cache)
+
+
+def _get_node_id(model_name: str, column_name: str) -> str:
+    # ids are made of names, so edges may refer to columns of clusters written later
+    return quote("{}/{}".format(model_name, column_name))
+
+
+def _write_cluster(output: IO[str], model_name: str, column_names: Sequence[str]):
+    # a cluster written again by the same name is the same cluster for dot
+    output.write("\tsubgraph {} {{\n".format(quote("cluster_{}".format(model_name))))
+    output.write("\t\tgraph{}\n".format(attr_list(model_name, CLUSTER_ATTR)))
+
+    # a column may be referenced by an edge before, so defaults of a cluster wouldn't apply
+    for column_name in column_names:
+        node_id = _get_node_id(model_name, column_name)
+        output.write("\t\t{}{}\n".format(node_id, attr_list(column_name, COLUMN_NODE_ATTR)))
+
+    output.write("\t}\n")
+
+
+def _write_edge(output: IO[str], tail: str, head: str, **attrs: str):
+    output.write("\t{} -> {}{}\n".format(tail, head, attr_list(None, attrs)))
+
+
+def _write_column_edges(output: IO[str], model_name: str, column_lineage: ColumnLineage):
+    current_node = _get_node_id(model_name, column_lineage.name)
+    formula = "" if column_lineage.formula == column_lineage.name else column_lineage.formula
+    has_many_columns = _has_many_columns(column_lineage)
+
+    if has_many_columns:
+        target_node = quote("{}/{}/".format(model_name, column_lineage.name))
+        output.write("\t{} [shape=point]\n".format(target_node))
+        label = ""
+    else:
+        target_node = current_node
+        label = formula
+
+    for source in column_lineage.sources:
+        for column in source.columns:
+            _write_edge(
+                output, _get_node_id(source.name, column), target_node, dir="back", label=label
+            )
+
+    if has_many_columns:
+        _write_edge(output, target_node, current_node, dir="none", label=formula)
+
+
+def write_lineage_dot(models: Iterable[ModelColumnsLineage], output: IO[str]):
+    """Write DOT source of lineage model by model, with clusters and edges as of draw_lineage."""
+    output.write("digraph G {\n")
+    output.write("\tgraph{}\n".format(attr_list(None, GRAPH_ATTR)))
+    output.write("\tedge{}\n".format(attr_list(None, EDGE_ATTR)))
+
+    model_columns: Dict[str, Set[str]] = {}
+    source_columns: Dict[str, Dict[str, None]] = {}
+
+    for model_columns_lineage in models:
+        column_names = [column_lineage.name for column_lineage in model_columns_lineage.columns]
+        _write_cluster(output, model_columns_lineage.name, column_names)
+        model_columns[model_columns_lineage.name] = set(column_names)
+
+        for model_name, column in _iter_source_columns(model_columns_lineage):
+            source_columns.setdefault(model_name, {})[column] = None
+
+        for column_lineage in model_columns_lineage.columns:
+            _write_column_edges(output, model_columns_lineage.name, column_lineage)
+
+    # columns of sources without lineage, e.g. skipped by a budget, are drawn as referenced
+    for model_name, columns in source_columns.items():
+        own_columns = model_columns.get(model_name, set())
+        referenced_columns = [column for column in columns if column not in own_columns]
+
+        if referenced_columns:
+            _write_cluster(output, model_name, referenced_columns)
+
+    output.write("}\n")
+
+
+def render_lineage_dot(models: Iterable[ModelColumnsLineage], path: str, format: str = "pdf"):
+    """Pipe DOT source of lineage into dot while it's written, so it's never kept in memory."""
+    try:
+        process = subprocess.Popen(
+            ["dot", "-T{}".format(format), "-o", path],
+            stdin=subprocess.PIPE,
+            encoding="utf-8",
+        )
+    except FileNotFoundError:
+        raise RuntimeException("Graphviz dot executable is required to render lineage.")
+
+    try:
+        with process.stdin:
+            write_lineage_dot(models, process.stdin)
+    except BrokenPipeError:
+        # dot failed, its return code is reported below
+        pass
 
-    g.render(filename, directory, cleanup=True)
+    if process.wait() != 0:
+        raise RuntimeException(
+            "dot failed to render {} with code {}.".format(path, process.returncode)
+        )
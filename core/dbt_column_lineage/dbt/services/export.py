@@ -0,0 +1,116 @@
+import csv
+from itertools import islice
+from typing import Callable, Dict, Iterable, Iterator, List, Set, Tuple, TypeVar
+from xml.sax.saxutils import escape, quoteattr
+
+from dbt.exceptions import RuntimeException
+from dbt_column_lineage.dbt.schemas.lineage import ModelColumnsLineage
+
+# source model, source column, target model, target column, formula
+Edge = Tuple[str, str, str, str, str]
+
+EDGE_FIELDS = ("source_model", "source_column", "target_model", "target_column", "formula")
+
+Exporter = Callable[[Iterable[ModelColumnsLineage], str, int], None]
+
+T = TypeVar("T")
+
+
+def iter_edges(models: Iterable[ModelColumnsLineage]) -> Iterator[Edge]:
+    for model in models:
+        for column in model.columns:
+            for source in column.sources:
+                for source_column in source.columns:
+                    yield source.name, source_column, model.name, column.name, column.formula
+
+
+def iter_chunks(items: Iterable[T], chunk_size: int) -> Iterator[List[T]]:
+    if chunk_size < 1:
+        raise ValueError("Chunk size must be positive, got {}.".format(chunk_size))
+
+    items = iter(items)
+
+    while True:
+        chunk = list(islice(items, chunk_size))
+
+        if not chunk:
+            return
+
+        yield chunk
+
+
+def export_csv(models: Iterable[ModelColumnsLineage], path: str, chunk_size: int):
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(EDGE_FIELDS)
+
+        for chunk in iter_chunks(iter_edges(models), chunk_size):
+            writer.writerows(chunk)
+
+
+def export_parquet(models: Iterable[ModelColumnsLineage], path: str, chunk_size: int):
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise RuntimeException("Export to Parquet requires pyarrow, run `pip install pyarrow`.")
+
+    schema = pa.schema([(name, pa.string()) for name in EDGE_FIELDS])
+
+    with pq.ParquetWriter(path, schema) as writer:
+        for chunk in iter_chunks(iter_edges(models), chunk_size):
+            columns = [list(values) for values in zip(*chunk)]
+            writer.write_table(pa.Table.from_arrays(columns, schema=schema))
+
+
+def _get_graphml_node(node_id: str, model: str, column: str) -> str:
+    return '<node id={}><data key="model">{}</data><data key="column">{}</data></node>\n'.format(
+        quoteattr(node_id), escape(model), escape(column)
+    )
+
+
+def _iter_graphml_model(model: ModelColumnsLineage, written: Set[str]) -> Iterator[str]:
+    # nodes of sources which don't have lineage themselves are written on first reference
+    for column in model.columns:
+        node_id = "{}.{}".format(model.name, column.name)
+        if node_id not in written:
+            written.add(node_id)
+            yield _get_graphml_node(node_id, model.name, column.name)
+
+    for source_model, source_column, _, target_column, formula in iter_edges([model]):
+        source_id = "{}.{}".format(source_model, source_column)
+        if source_id not in written:
+            written.add(source_id)
+            yield _get_graphml_node(source_id, source_model, source_column)
+
+        yield '<edge source={} target={}><data key="formula">{}</data></edge>\n'.format(
+            quoteattr(source_id),
+            quoteattr("{}.{}".format(model.name, target_column)),
+            escape(formula),
+        )
+
+
+def export_graphml(models: Iterable[ModelColumnsLineage], path: str, chunk_size: int):
+    # only ids of written nodes are kept, elements are written by chunks as models are read
+    written: Set[str] = set()
+    elements = (element for model in models for element in _iter_graphml_model(model, written))
+
+    with open(path, "w") as f:
+        f.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+        f.write('<graphml xmlns="http://graphml.graphdrawing.org/xmlns">\n')
+        f.write('<key id="model" for="node" attr.name="model" attr.type="string"/>\n')
+        f.write('<key id="column" for="node" attr.name="column" attr.type="string"/>\n')
+        f.write('<key id="formula" for="edge" attr.name="formula" attr.type="string"/>\n')
+        f.write('<graph id="column_lineage" edgedefault="directed">\n')
+
+        for chunk in iter_chunks(elements, chunk_size):
+            f.write("".join(chunk))
+
+        f.write("</graph>\n</graphml>\n")
+
+
+EXPORTERS: Dict[str, Exporter] = {
+    "csv": export_csv,
+    "parquet": export_parquet,
+    "graphml": export_graphml,
+}
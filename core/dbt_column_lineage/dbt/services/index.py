@@ -0,0 +1,135 @@
+import threading
+from collections import defaultdict, deque
+from typing import (
+    Callable,
+    Container,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from dbt_column_lineage.dbt.schemas.lineage import ColumnLineage, ModelColumnsLineage
+
+# model unique_id and column name
+ColumnKey = Tuple[str, str]
+
+
+def iter_column_sources(column: ColumnLineage) -> Iterator[ColumnKey]:
+    for source in column.sources:
+        for name in source.columns:
+            yield source.name, name
+
+
+class LineageIndex:
+    """Columns lineage of models in memory with edges to upstream and downstream columns.
+
+    It's updated by one writer while queries are answered on other threads, so access is locked.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._models: Dict[str, ModelColumnsLineage] = {}
+        self._columns: Dict[ColumnKey, ColumnLineage] = {}
+        self._downstream: Dict[ColumnKey, Set[ColumnKey]] = defaultdict(set)
+
+    def update(self, models: Iterable[ModelColumnsLineage]):
+        with self._lock:
+            for model in models:
+                self._remove(model.name)
+                self._add(model)
+
+    def retain(self, unique_ids: Container[str]):
+        with self._lock:
+            removed = [name for name in self._models if name not in unique_ids]
+            for name in removed:
+                self._remove(name)
+
+    def _add(self, model: ModelColumnsLineage):
+        self._models[model.name] = model
+
+        for column in model.columns:
+            key = (model.name, column.name)
+            self._columns[key] = column
+
+            for upstream in iter_column_sources(column):
+                self._downstream[upstream].add(key)
+
+    def _remove(self, name: str):
+        model = self._models.pop(name, None)
+
+        if model is None:
+            return
+
+        for column in model.columns:
+            key = (model.name, column.name)
+            self._columns.pop(key, None)
+
+            for upstream in iter_column_sources(column):
+                downstream = self._downstream.get(upstream)
+                if downstream is not None:
+                    downstream.discard(key)
+
+    def models(self) -> List[ModelColumnsLineage]:
+        with self._lock:
+            return list(self._models.values())
+
+    def names(self) -> List[str]:
+        with self._lock:
+            return list(self._models)
+
+    def get_model(self, name: str) -> Optional[ModelColumnsLineage]:
+        with self._lock:
+            return self._models.get(name)
+
+    def get_column(self, name: str, column: str) -> Optional[ColumnLineage]:
+        with self._lock:
+            return self._columns.get((name, column))
+
+    def upstream(
+        self, name: str, column: str, depth: Optional[int] = None
+    ) -> List[Tuple[int, ColumnKey]]:
+        def get_upstream(key: ColumnKey) -> Iterable[ColumnKey]:
+            column_lineage = self._columns.get(key)
+            return iter_column_sources(column_lineage) if column_lineage else ()
+
+        return self._traverse((name, column), get_upstream, depth)
+
+    def downstream(
+        self, name: str, column: str, depth: Optional[int] = None
+    ) -> List[Tuple[int, ColumnKey]]:
+        def get_downstream(key: ColumnKey) -> Iterable[ColumnKey]:
+            return self._downstream.get(key, ())
+
+        return self._traverse((name, column), get_downstream, depth)
+
+    def _traverse(
+        self,
+        start: ColumnKey,
+        get_next: Callable[[ColumnKey], Iterable[ColumnKey]],
+        depth: Optional[int],
+    ) -> List[Tuple[int, ColumnKey]]:
+        # breadth first, so every column is reported at its shortest distance
+        res: List[Tuple[int, ColumnKey]] = []
+        visited = {start}
+        queue = deque([(0, start)])
+
+        with self._lock:
+            while queue:
+                distance, key = queue.popleft()
+
+                if depth is not None and distance >= depth:
+                    continue
+
+                for next_key in get_next(key):
+                    if next_key in visited:
+                        continue
+
+                    visited.add(next_key)
+                    res.append((distance + 1, next_key))
+                    queue.append((distance + 1, next_key))
+
+        return res
@@ -0,0 +1,66 @@
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from operator import attrgetter
+from typing import Dict, Iterable, Tuple
+
+from dbt.adapters.base import BaseRelation as DBTRelation
+from dbt.adapters.sql import SQLAdapter
+
+INTROSPECTION_CONNECTION_NAME = "column_lineage_introspection"
+
+
+def get_dbt_relation_columns(adapter: SQLAdapter, dbt_relation: DBTRelation) -> Tuple[str, ...]:
+    # connection of a thread is kept open for next calls,
+    # all connections are closed by adapter at the end of a run
+    if adapter.connections.get_if_exists() is None:
+        adapter.acquire_connection(INTROSPECTION_CONNECTION_NAME)
+
+    columns = adapter.get_columns_in_relation(dbt_relation)
+    column_names = tuple(map(attrgetter("name"), columns))
+
+    return column_names
+
+
+class RelationIntrospector:
+    """Queries columns of relations on a bounded pool of threads.
+
+    Every thread of the pool opens one connection on its first call and reuses it till the end
+    of a run instead of acquiring and releasing a named connection per relation.
+    Queries are cached per relation, so they can be started ahead with `prefetch`
+    and consumed later by runners.
+    """
+
+    def __init__(self, adapter: SQLAdapter, max_workers: int):
+        self.adapter = adapter
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix=INTROSPECTION_CONNECTION_NAME,
+        )
+        self._lock = threading.Lock()
+        self._futures: Dict[DBTRelation, Future] = {}
+
+    def _submit(self, dbt_relation: DBTRelation) -> Future:
+        with self._lock:
+            future = self._futures.get(dbt_relation)
+
+            if future is None:
+                future = self._executor.submit(get_dbt_relation_columns, self.adapter, dbt_relation)
+                self._futures[dbt_relation] = future
+
+        return future
+
+    def prefetch(self, dbt_relations: Iterable[DBTRelation]):
+        for dbt_relation in dbt_relations:
+            self._submit(dbt_relation)
+
+    def invalidate(self, dbt_relations: Iterable[DBTRelation]):
+        """Drop cached columns of relations, so they're queried again on next use."""
+        with self._lock:
+            for dbt_relation in dbt_relations:
+                self._futures.pop(dbt_relation, None)
+
+    def get_columns(self, dbt_relation: DBTRelation) -> Tuple[str, ...]:
+        return self._submit(dbt_relation).result()
+
+    def close(self):
+        self._executor.shutdown(cancel_futures=True)
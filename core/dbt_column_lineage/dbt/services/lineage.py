@@ -1,45 +1,110 @@
 import re
-from operator import attrgetter
-from typing import List, Tuple, Union
+from dataclasses import dataclass
+from functools import partial
+from typing import Callable, Collection, Iterable, List, Optional, Tuple, Union
 
 from dbt.adapters.base import BaseRelation as DBTRelation
-from dbt.adapters.sql import SQLAdapter
 from dbt.contracts.graph.compiled import CompiledModelNode, CompiledSeedNode
 from dbt.contracts.graph.manifest import Manifest
 from dbt.contracts.relation import ComponentName
 from dbt.contracts.relation import Path as DBTPath
+from dbt.events import AdapterLogger
+from dbt.exceptions import RuntimeException
 from dbt.node_types import NodeType
-from dbt_column_lineage.dbt.schemas.lineage import ColumnLineage, ColumnsLineage, Source
-from dbt_column_lineage.parser.main import resolve_columns_lineage
+from dbt_column_lineage.dbt.exceptions import EphemeralColumnsNotFoundException
+from dbt_column_lineage.dbt.schemas.lineage import (
+    ColumnLineage,
+    ColumnsLineage,
+    ModelColumnsLineage,
+    Source,
+)
+from dbt_column_lineage.dbt.services.columns import ColumnsLookup
+from dbt_column_lineage.dbt.services.introspection import RelationIntrospector
+from dbt_column_lineage.dbt.services.timings import Measure, Timings
+from dbt_column_lineage.parser.backends.base import ParserBackend
+from dbt_column_lineage.parser.budget import Budget
+from dbt_column_lineage.parser.exceptions import BudgetExceededException
+from dbt_column_lineage.parser.main import no_measure, resolve_columns_lineage
 from dbt_column_lineage.parser.schemas.relation import Path, Relation
+from dbt_column_lineage.parser.services.template import TemplateCache
+
+logger = AdapterLogger("ColumnLineage")
+
+
+@dataclass(frozen=True)
+class LineageOptions:
+    """Settings of lineage parsing shared by all nodes of a run."""
+
+    timings: Optional[Timings] = None
+    max_formula_length: Optional[int] = None
+    backend: Optional[ParserBackend] = None
+    templates: Optional[TemplateCache] = None
+    budget: Optional[Budget] = None
+
+    def get_measure(self, unique_id: str) -> Measure:
+        return no_measure if self.timings is None else self.timings.node_measure(unique_id)
 
 
 def get_node_columns_lineage(
-    adapter: SQLAdapter,
+    columns_lookup: ColumnsLookup,
     manifest: Manifest,
     node: Union[CompiledModelNode, CompiledSeedNode],
+    options: LineageOptions = LineageOptions(),
+    columns: Optional[Collection[str]] = None,
+) -> ColumnsLineage:
+    resolve = partial(_get_node_columns_lineage, columns_lookup, manifest, node, options)
+
+    # an ephemeral model is inlined into every model selecting from it, so it's resolved once
+    if node.is_ephemeral_model and columns is None:
+        return columns_lookup.ephemerals.get(node.unique_id, resolve)
+
+    return resolve(columns)
+
+
+def _get_node_columns_lineage(
+    columns_lookup: ColumnsLookup,
+    manifest: Manifest,
+    node: Union[CompiledModelNode, CompiledSeedNode],
+    options: LineageOptions = LineageOptions(),
+    columns: Optional[Collection[str]] = None,
 ) -> ColumnsLineage:
     dbt_columns_lineage = []
-    depends_on_models = list(
-        filter(
-            lambda n: n.resource_type in (NodeType.Model, NodeType.Seed),
-            map(lambda n: manifest.nodes[n], node.depends_on_nodes),
-        )
-    )
+    depends_on_models = _get_depends_on_models(manifest, node)
+    measure = options.get_measure(node.unique_id)
 
     if not depends_on_models:
-        dbt_relation = _get_dbt_relation_from_node(node)
-        column_names = get_dbt_relation_columns(adapter, dbt_relation)
+        with measure("introspection"):
+            column_names = _get_node_columns(columns_lookup, node)
+        if columns is not None:
+            # matched case-insensitively as by the parser, e.g. seeds are upper case on Snowflake
+            folded = {column.lower() for column in columns}
+            column_names = [name for name in column_names if name.lower() in folded]
         dbt_columns_lineage.extend(
             [ColumnLineage(name=column_name) for column_name in column_names]
         )
         return dbt_columns_lineage
 
+    # ephemeral models are measured by their own unique_id
+    get_ephemeral_lineage = partial(
+        get_node_columns_lineage, columns_lookup, manifest, options=options
+    )
+
     initial_relations = []
     for depends_on_model in depends_on_models:
-        initial_relations.append(_get_relation_from_node(adapter, depends_on_model))
+        initial_relations.append(
+            _get_initial_relation(columns_lookup, depends_on_model, measure, get_ephemeral_lineage)
+        )
 
-    columns_lineage = resolve_columns_lineage(node.compiled_sql, initial_relations)
+    columns_lineage = resolve_columns_lineage(
+        node.compiled_sql,
+        initial_relations,
+        measure,
+        options.max_formula_length,
+        options.backend,
+        options.templates,
+        options.budget,
+        columns,
+    )
 
     # replace relation with model unique_id
     relation_model_map = dict(zip(initial_relations, depends_on_models))
@@ -66,11 +131,139 @@ def get_node_columns_lineage(
     return dbt_columns_lineage
 
 
+def get_model_columns_lineage(
+    columns_lookup: ColumnsLookup,
+    manifest: Manifest,
+    node: Union[CompiledModelNode, CompiledSeedNode],
+    options: LineageOptions = LineageOptions(),
+    columns: Optional[Collection[str]] = None,
+) -> ModelColumnsLineage:
+    """Get lineage of a node, a node out of budget or inlining an ephemeral model
+    with unknown columns is skipped with empty columns.
+    """
+    try:
+        columns_lineage = get_node_columns_lineage(columns_lookup, manifest, node, options, columns)
+    except BudgetExceededException as e:
+        return _skip_model(node, "budget exceeded: {}".format(e))
+    except EphemeralColumnsNotFoundException as e:
+        return _skip_model(node, "columns not found: {}".format(e))
+
+    return ModelColumnsLineage(name=node.unique_id, columns=columns_lineage)
+
+
+def _skip_model(
+    node: Union[CompiledModelNode, CompiledSeedNode], reason: str
+) -> ModelColumnsLineage:
+    logger.warning("Lineage of {} is skipped: {}".format(node.unique_id, reason))
+    return ModelColumnsLineage(name=node.unique_id, columns=[], skipped_reason=reason)
+
+
+def prefetch_columns(
+    columns_lookup: ColumnsLookup,
+    manifest: Manifest,
+    unique_ids: Iterable[str],
+):
+    """Start introspection of all relations required to get lineage of nodes.
+
+    Relations of nodes with columns known without the warehouse aren't queried.
+    """
+    dbt_relations = {
+        _get_dbt_relation_from_node(node)
+        for node in _get_introspected_nodes(manifest, unique_ids)
+        if columns_lookup.get_local_columns(node) is None
+    }
+
+    if columns_lookup.uses_warehouse:
+        columns_lookup.introspector.prefetch(dbt_relations)
+
+
+def invalidate_columns(
+    introspector: RelationIntrospector, manifest: Manifest, unique_ids: Iterable[str]
+):
+    """Drop queried columns of relations lineage of nodes is resolved from,
+    e.g. of changed nodes and their children, so they're queried again.
+    """
+    introspector.invalidate(
+        _get_dbt_relation_from_node(node) for node in _get_introspected_nodes(manifest, unique_ids)
+    )
+
+
+def _get_introspected_nodes(
+    manifest: Manifest, unique_ids: Iterable[str]
+) -> List[Union[CompiledModelNode, CompiledSeedNode]]:
+    # a node is resolved from columns of models it depends on, or of itself if there are none,
+    # while ephemeral models are resolved from their lineage
+    nodes = {}
+
+    for unique_id in unique_ids:
+        node = manifest.nodes[unique_id]
+
+        for model in _get_depends_on_models(manifest, node) or [node]:
+            if not model.is_ephemeral_model:
+                nodes[model.unique_id] = model
+
+    return list(nodes.values())
+
+
+def _get_depends_on_models(
+    manifest: Manifest,
+    node: Union[CompiledModelNode, CompiledSeedNode],
+) -> List[Union[CompiledModelNode, CompiledSeedNode]]:
+    return list(
+        filter(
+            lambda n: n is not None and n.resource_type in (NodeType.Model, NodeType.Seed),
+            # sources aren't nodes
+            map(manifest.nodes.get, node.depends_on_nodes),
+        )
+    )
+
+
+def _get_node_columns(
+    columns_lookup: ColumnsLookup, node: Union[CompiledModelNode, CompiledSeedNode]
+) -> Tuple[str, ...]:
+    column_names = columns_lookup.get_local_columns(node)
+
+    if column_names is not None:
+        return column_names
+
+    # ephemeral models don't have relations, so columns of ones selecting from sources only
+    # are known if declared
+    if node.is_ephemeral_model:
+        raise EphemeralColumnsNotFoundException(
+            "Ephemeral model {} depends only on sources, declare its columns in a schema file "
+            "and use the declared column resolution".format(node.unique_id)
+        )
+
+    if not columns_lookup.uses_warehouse:
+        raise RuntimeException(
+            "Columns of {} are found by none of column resolutions: {}".format(
+                node.unique_id, ", ".join(columns_lookup.resolutions)
+            )
+        )
+
+    return columns_lookup.introspector.get_columns(_get_dbt_relation_from_node(node))
+
+
+def _get_initial_relation(
+    columns_lookup: ColumnsLookup,
+    node: Union[CompiledModelNode, CompiledSeedNode],
+    measure: Measure,
+    get_ephemeral_lineage: Callable[[CompiledModelNode], ColumnsLineage],
+) -> Relation:
+    if node.is_ephemeral_model:
+        # a cte of an ephemeral model is referenced by its name only, its body isn't parsed
+        field_names = tuple(column.name for column in get_ephemeral_lineage(node))
+        path = Path(identifier=DBTRelation.add_ephemeral_prefix(node.name))
+        return Relation(path=path, field_names=field_names)
+
+    with measure("introspection"):
+        return _get_relation_from_node(columns_lookup, node)
+
+
 def _get_relation_from_node(
-    adapter: SQLAdapter, node: Union[CompiledModelNode, CompiledSeedNode]
+    columns_lookup: ColumnsLookup, node: Union[CompiledModelNode, CompiledSeedNode]
 ) -> Relation:
-    dbt_relation = _get_dbt_relation_from_node(node)
-    field_names = get_dbt_relation_columns(adapter, dbt_relation)
+    field_names = _get_node_columns(columns_lookup, node)
 
     vals = _get_node_relation_name_vals(node)
     path = _get_path_from_vals(vals)
@@ -93,17 +286,6 @@ def _get_dbt_relation_from_node(node: Union[CompiledModelNode, CompiledSeedNode]
     return DBTRelation(path=dbt_path)
 
 
-def get_dbt_relation_columns(adapter: SQLAdapter, dbt_relation: DBTRelation) -> Tuple[str, ...]:
-    # TODO: cache got relations
-
-    with adapter.connection_named("master"):
-        columns = adapter.get_columns_in_relation(dbt_relation)
-
-    column_names = tuple(map(attrgetter("name"), columns))
-
-    return column_names
-
-
 def _get_dbt_path_from_vals(vals: List[str]) -> DBTPath:
     # TODO: check for vals length ?
     component_names = list(map(str, ComponentName))
@@ -0,0 +1,51 @@
+import csv
+import os
+from functools import lru_cache
+from typing import Callable, Dict, Optional, Tuple
+
+from dbt.adapters.sql import SQLAdapter
+from dbt.contracts.graph.compiled import CompiledSeedNode
+
+# dbt strips a byte order mark of a seed file too
+SEED_ENCODING = "utf-8-sig"
+
+# warehouses fold names of columns created unquoted
+UNQUOTED_NAME_FOLDING: Dict[str, Callable[[str], str]] = {
+    "postgres": str.lower,
+    "redshift": str.lower,
+    "snowflake": str.upper,
+}
+
+
+@lru_cache(maxsize=None)
+def _read_csv_header(path: str, checksum: str, mtime: float) -> Tuple[str, ...]:
+    # a checksum of a large seed is its path, so a modification time is a part of a key too
+    with open(path, newline="", encoding=SEED_ENCODING) as f:
+        return tuple(next(csv.reader(f), ()))
+
+
+def _get_name_folding(
+    adapter: SQLAdapter, quote_config: Optional[bool]
+) -> Optional[Callable[[str], str]]:
+    # adapters have own defaults of quote_columns, e.g. snowflake doesn't quote them
+    if adapter.quote_seed_column("column", quote_config) != "column":
+        # quoted names are kept as written
+        return str
+
+    return UNQUOTED_NAME_FOLDING.get(adapter.type())
+
+
+def get_seed_columns(node: CompiledSeedNode, adapter: SQLAdapter) -> Optional[Tuple[str, ...]]:
+    """Get columns of a seed from the header of its file named as dbt creates them,
+    None if the file isn't in the project or the adapter folds unquoted names unknown way.
+
+    Only the first line of a file is read, headers are cached by checksums of files.
+    """
+    path = os.path.join(node.root_path, node.original_file_path)
+    fold = _get_name_folding(adapter, node.config.quote_columns)
+
+    if fold is None or not os.path.isfile(path):
+        return None
+
+    header = _read_csv_header(path, node.checksum.checksum, os.path.getmtime(path))
+    return tuple(map(fold, header))
@@ -0,0 +1,129 @@
+import json
+import os
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from socketserver import BaseServer, ThreadingMixIn, UnixStreamServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from dbt.events import AdapterLogger
+from dbt_column_lineage.dbt.services.index import ColumnKey, LineageIndex
+
+logger = AdapterLogger("ColumnLineage")
+
+Response = Tuple[HTTPStatus, Any]
+
+NOT_FOUND: Response = (HTTPStatus.NOT_FOUND, {"error": "not found"})
+
+
+def _get_depth(query: Dict[str, List[str]]) -> Optional[int]:
+    values = query.get("depth")
+    return int(values[0]) if values else None
+
+
+def _related_to_dict(related: List[Tuple[int, ColumnKey]]) -> List[Dict[str, Any]]:
+    return [{"model": name, "column": column, "depth": depth} for depth, (name, column) in related]
+
+
+def _handle_column(
+    index: LineageIndex, name: str, column: str, parts: List[str], query: Dict[str, List[str]]
+) -> Response:
+    if not parts:
+        column_lineage = index.get_column(name, column)
+        return (HTTPStatus.OK, column_lineage.to_dict()) if column_lineage else NOT_FOUND
+
+    if parts == ["upstream"]:
+        return HTTPStatus.OK, _related_to_dict(index.upstream(name, column, _get_depth(query)))
+
+    if parts == ["downstream"]:
+        return HTTPStatus.OK, _related_to_dict(index.downstream(name, column, _get_depth(query)))
+
+    return NOT_FOUND
+
+
+def handle_query(index: LineageIndex, parts: List[str], query: Dict[str, List[str]]) -> Response:
+    """Answer a query by parts of its path.
+
+    /models
+    /models/<unique_id>
+    /models/<unique_id>/columns/<column>
+    /models/<unique_id>/columns/<column>/upstream?depth=<n>
+    /models/<unique_id>/columns/<column>/downstream?depth=<n>
+    """
+    if parts[:1] != ["models"]:
+        return NOT_FOUND
+
+    if len(parts) == 1:
+        return HTTPStatus.OK, index.names()
+
+    if len(parts) == 2:
+        model = index.get_model(parts[1])
+        return (HTTPStatus.OK, model.to_dict()) if model else NOT_FOUND
+
+    if len(parts) >= 4 and parts[2] == "columns":
+        return _handle_column(index, parts[1], parts[3], parts[4:], query)
+
+    return NOT_FOUND
+
+
+class LineageRequestHandler(BaseHTTPRequestHandler):
+    server: Any
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        parts = [unquote(part) for part in url.path.split("/") if part]
+
+        try:
+            status, body = handle_query(self.server.index, parts, parse_qs(url.query))
+        except ValueError as e:
+            status, body = HTTPStatus.BAD_REQUEST, {"error": str(e)}
+
+        data = json.dumps(body).encode()
+
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def address_string(self) -> str:
+        # clients of a unix socket don't have an address
+        return self.client_address[0] if self.client_address else "unix"
+
+    def log_message(self, format, *args):
+        logger.debug("{} - {}".format(self.address_string(), format % args))
+
+
+class LineageHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address: Tuple[str, int], index: LineageIndex):
+        super().__init__(address, LineageRequestHandler)
+        self.index = index
+
+
+class LineageUnixServer(ThreadingMixIn, UnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, path: str, index: LineageIndex):
+        # socket of a previous run is left if it wasn't stopped gracefully
+        if os.path.exists(path):
+            os.remove(path)
+
+        super().__init__(path, LineageRequestHandler)
+        self.index = index
+
+    def server_close(self):
+        super().server_close()
+
+        if os.path.exists(self.server_address):
+            os.remove(self.server_address)
+
+
+def create_server(
+    index: LineageIndex, host: str, port: int, socket_path: Optional[str] = None
+) -> BaseServer:
+    if socket_path:
+        return LineageUnixServer(socket_path, index)
+
+    return LineageHTTPServer((host, port), index)
@@ -0,0 +1,99 @@
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import partial
+from typing import Any, Callable, ContextManager, Dict, Iterator, List, Optional, Tuple
+
+from dbt.clients.system import write_json
+from dbt.events import AdapterLogger
+
+logger = AdapterLogger("ColumnLineage")
+
+Measure = Callable[[str], ContextManager]
+
+
+@dataclass
+class StageTiming:
+    total: float = 0.0
+    calls: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"total": self.total, "calls": self.calls}
+
+
+class Timings:
+    """Thread safe collection of stage timings and call counts of nodes and a run itself."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.nodes: Dict[str, Dict[str, StageTiming]] = defaultdict(dict)
+        self.run: Dict[str, StageTiming] = {}
+
+    @contextmanager
+    def measure(self, unique_id: Optional[str], stage: str) -> Iterator[None]:
+        start = time.perf_counter()
+
+        try:
+            yield
+        finally:
+            self.add(unique_id, stage, time.perf_counter() - start)
+
+    def node_measure(self, unique_id: str) -> Measure:
+        return partial(self.measure, unique_id)
+
+    def add(self, unique_id: Optional[str], stage: str, elapsed: float):
+        with self._lock:
+            stages = self.run if unique_id is None else self.nodes[unique_id]
+            timing = stages.setdefault(stage, StageTiming())
+            timing.total += elapsed
+            timing.calls += 1
+
+    def slowest(self, n: int) -> List[Tuple[str, float]]:
+        totals = (
+            (unique_id, sum(timing.total for timing in stages.values()))
+            for unique_id, stages in self.nodes.items()
+        )
+        return sorted(totals, key=lambda total: total[1], reverse=True)[:n]
+
+    def stages(self) -> Dict[str, StageTiming]:
+        res: Dict[str, StageTiming] = {}
+
+        for stages in self.nodes.values():
+            for stage, timing in stages.items():
+                total = res.setdefault(stage, StageTiming())
+                total.total += timing.total
+                total.calls += timing.calls
+
+        return res
+
+    def to_dict(self, slowest: int) -> Dict[str, Any]:
+        def stages_to_dict(stages: Dict[str, StageTiming]) -> Dict[str, Any]:
+            return {stage: timing.to_dict() for stage, timing in stages.items()}
+
+        return {
+            "run": stages_to_dict(self.run),
+            "stages": stages_to_dict(self.stages()),
+            "slowest": [
+                {"name": unique_id, "total": total} for unique_id, total in self.slowest(slowest)
+            ],
+            "nodes": {
+                unique_id: stages_to_dict(stages) for unique_id, stages in self.nodes.items()
+            },
+        }
+
+    def write(self, path: str, slowest: int):
+        write_json(path, self.to_dict(slowest))
+
+    def log_summary(self, slowest: int):
+        logger.info("Column lineage timings by stage:")
+        for stage, timing in self.stages().items():
+            logger.info("  {}: {:.3f}s in {} calls".format(stage, timing.total, timing.calls))
+
+        for stage, timing in self.run.items():
+            logger.info("  {}: {:.3f}s".format(stage, timing.total))
+
+        logger.info("Slowest models:")
+        for unique_id, total in self.slowest(slowest):
+            logger.info("  {}: {:.3f}s".format(unique_id, total))
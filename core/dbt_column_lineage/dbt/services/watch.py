@@ -0,0 +1,53 @@
+import os
+from typing import Dict, Iterable, List, Tuple
+
+SCHEMA_FILE_EXTENSIONS = (".yml", ".yaml")
+# schema files declare columns of nodes
+NODE_FILE_EXTENSIONS = (".sql", ".csv", *SCHEMA_FILE_EXTENSIONS)
+
+
+def get_files_mtimes(
+    root: str, directories: Iterable[str], extensions: Tuple[str, ...]
+) -> Dict[str, float]:
+    # paths are relative to root, as dbt paths of nodes
+    mtimes = {}
+
+    for directory in directories:
+        for dirpath, _, filenames in os.walk(os.path.join(root, directory)):
+            for filename in filenames:
+                if not filename.endswith(extensions):
+                    continue
+
+                path = os.path.join(dirpath, filename)
+                mtimes[os.path.relpath(path, root)] = os.path.getmtime(path)
+
+    return mtimes
+
+
+class FilesWatcher:
+    """Polls modification times of files of nodes and their schemas,
+    so no platform specific watcher is needed.
+    """
+
+    def __init__(
+        self,
+        root: str,
+        directories: Iterable[str],
+        extensions: Tuple[str, ...] = NODE_FILE_EXTENSIONS,
+    ):
+        self.root = root
+        self.directories = list(directories)
+        self.extensions = extensions
+        self._mtimes = self._get_mtimes()
+
+    def _get_mtimes(self) -> Dict[str, float]:
+        return get_files_mtimes(self.root, self.directories, self.extensions)
+
+    def poll(self) -> List[str]:
+        """Return paths of files added, changed or removed since the previous poll."""
+        mtimes = self._get_mtimes()
+        paths = set(mtimes) | set(self._mtimes)
+        changed = [path for path in paths if mtimes.get(path) != self._mtimes.get(path)]
+        self._mtimes = mtimes
+
+        return sorted(changed)
@@ -0,0 +1,42 @@
+import json
+import sys
+from collections import Counter
+from contextlib import nullcontext
+from typing import IO, ContextManager
+
+from dbt.events import AdapterLogger
+from dbt.task.base import BaseTask
+from dbt_column_lineage.dbt.schemas.lineage import LazyModelsColumnsLineage
+from dbt_column_lineage.dbt.services.diff import diff_lineage
+
+logger = AdapterLogger("ColumnLineage")
+
+
+class DiffTask(BaseTask):
+    """Compare two lineage manifests and stream changes as JSON lines.
+
+    It doesn't need a project, so it's run without a config.
+    """
+
+    def open_output(self) -> ContextManager[IO[str]]:
+        if self.args.output:
+            return open(self.args.output, "w")
+
+        return nullcontext(sys.stdout)
+
+    def run(self) -> Counter:
+        old = LazyModelsColumnsLineage.read(self.args.old)
+        new = LazyModelsColumnsLineage.read(self.args.new)
+        counts: Counter = Counter()
+
+        with self.open_output() as output:
+            for change in diff_lineage(old, new):
+                level = "models" if change.column is None else "columns"
+                counts["{} {}".format(change.status, level)] += 1
+                output.write(json.dumps(change.to_dict(omit_none=True)) + "\n")
+
+        logger.info("Column lineage changes:")
+        for name, count in sorted(counts.items()):
+            logger.info("  {}: {}".format(name, count))
+
+        return counts
@@ -1,17 +1,65 @@
+import os
+
+from dbt.events import AdapterLogger
 from dbt.exceptions import InternalException
 from dbt_column_lineage.dbt.consts import COLUMN_LINEAGE_DOCS_FILENAME
-from dbt_column_lineage.dbt.paths import get_column_lineage_directory
-from dbt_column_lineage.dbt.services.docs import draw_lineage
+from dbt_column_lineage.dbt.paths import (
+    get_column_lineage_directory,
+    get_column_lineage_docs_cache_directory,
+)
+from dbt_column_lineage.dbt.services.docs import (
+    RenderCache,
+    draw_lineage,
+    draw_models_lineage,
+    render_lineage_dot,
+    write_lineage_dot,
+)
 from dbt_column_lineage.dbt.tasks.lineage import LineageTask
 
+logger = AdapterLogger("ColumnLineage")
+
 
 class DocsTask(LineageTask):
+    def stream_lineage(self, filename: str, directory: str):
+        # models are decoded one by one and no graph is built, while the manifest is read whole
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, filename)
+
+        if self.args.dot_only:
+            with open("{}.gv".format(path), "w") as f:
+                write_lineage_dot(self.lineage.iter_models(), f)
+        else:
+            render_lineage_dot(self.lineage.iter_models(), "{}.pdf".format(path))
+
+    def draw_lineage(self, filename: str, directory: str):
+        cache = (
+            None
+            if self.args.no_render_cache
+            else RenderCache(get_column_lineage_docs_cache_directory(self.config))
+        )
+
+        if self.args.per_model:
+            draw_models_lineage(
+                self.lineage.iter_models(), os.path.join(directory, filename), cache
+            )
+        else:
+            draw_lineage(self.lineage, filename, directory, cache)
+
+        if cache is not None:
+            # renders of changed or removed diagrams
+            cache.prune()
+            logger.info("Diagrams rendered: {}, reused: {}".format(cache.misses, cache.hits))
+
     def run(self):
         self._runtime_initialize()
 
-        if not self.lineage:
+        if self.lineage is None:
             raise InternalException("Initially column lineage manifest must be created.")
 
         filename = COLUMN_LINEAGE_DOCS_FILENAME
         directory = get_column_lineage_directory(self.config)
-        draw_lineage(self.lineage, filename, directory)
+
+        if self.args.stream or self.args.dot_only:
+            self.stream_lineage(filename, directory)
+        else:
+            self.draw_lineage(filename, directory)
@@ -0,0 +1,58 @@
+import json
+import sys
+from typing import List
+
+from dbt.events import AdapterLogger
+from dbt_column_lineage.dbt.schemas.lineage import ModelsColumnsLineage
+from dbt_column_lineage.dbt.tasks.parse import (
+    ParseColumnLineageRunner,
+    ParseColumnLineageTask,
+)
+
+logger = AdapterLogger("ColumnLineage")
+
+
+class ExplainTask(ParseColumnLineageTask):
+    """Print lineage of a few columns of selected models.
+
+    Only fields the columns depend on are resolved, and the lineage manifest isn't written,
+    as it would hold partial lineage.
+    """
+
+    def __init__(self, args, config):
+        super().__init__(args, config)
+        # names of columns are matched case-insensitively, as compiled SQL and warehouses
+        # fold unquoted names differently
+        self.columns: List[str] = list(args.columns)
+
+    def get_runner(self, node) -> ParseColumnLineageRunner:
+        runner = super().get_runner(node)
+        runner.columns = self.columns
+        return runner
+
+    def log_missing(self, models_columns_lineage: ModelsColumnsLineage):
+        for model in models_columns_lineage.models:
+            found = {column.name.lower() for column in model.columns}
+            missing = [column for column in self.columns if column.lower() not in found]
+
+            if missing and model.skipped_reason is None:
+                logger.warning(
+                    "Model {} doesn't have columns: {}".format(model.name, ", ".join(missing))
+                )
+
+    def run(self) -> ModelsColumnsLineage:
+        try:
+            models = self.parse_lineage()
+        finally:
+            self.close_introspector()
+
+        models_columns_lineage = ModelsColumnsLineage(models=models)
+        self.log_skipped(models_columns_lineage)
+        self.log_missing(models_columns_lineage)
+
+        if self.args.log_timings:
+            self.timings.log_summary(self.args.timings_slowest)
+
+        sys.stdout.write(json.dumps(models_columns_lineage.to_dict(), indent=2) + "\n")
+
+        return models_columns_lineage
@@ -0,0 +1,23 @@
+from dbt.exceptions import InternalException
+from dbt_column_lineage.dbt.paths import get_column_lineage_export_path
+from dbt_column_lineage.dbt.services.export import EXPORTERS
+from dbt_column_lineage.dbt.tasks.lineage import LineageTask
+
+
+class ExportTask(LineageTask):
+    """Stream column edges of the lineage manifest to an edge list or a graph file.
+
+    The manifest is read whole, so memory is bound by its size rather than constant.
+    """
+
+    def run(self):
+        self._runtime_initialize()
+
+        if self.lineage is None:
+            raise InternalException("Initially column lineage manifest must be created.")
+
+        export_format = self.args.format
+        path = self.args.output or get_column_lineage_export_path(self.config, export_format)
+
+        # models are decoded one by one without keeping them
+        EXPORTERS[export_format](self.lineage.iter_models(), path, self.args.chunk_size)
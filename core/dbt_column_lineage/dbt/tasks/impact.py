@@ -0,0 +1,82 @@
+import json
+import os
+import sys
+from typing import Any, Dict, List
+
+from dbt.contracts.graph.manifest import WritableManifest
+from dbt.events import AdapterLogger
+from dbt.exceptions import InternalException, RuntimeException
+from dbt.task.runnable import MANIFEST_FILE_NAME
+from dbt_column_lineage.dbt.services.closure import ColumnClosure
+from dbt_column_lineage.dbt.services.index import ColumnKey
+from dbt_column_lineage.dbt.tasks.lineage import LineageTask
+
+logger = AdapterLogger("ColumnLineage")
+
+
+def _keys_to_dicts(keys: List[ColumnKey]) -> List[Dict[str, str]]:
+    return [{"model": name, "column": column} for name, column in keys]
+
+
+class ImpactTask(LineageTask):
+    """Print origins of columns, and columns, models and exposures depending on them.
+
+    Exposures are read from the dbt manifest, they're omitted if it's not compiled.
+    """
+
+    def get_keys(self) -> List[ColumnKey]:
+        # unique_id and column are joined by the last dot
+        keys = [tuple(column.rsplit(".", 1)) for column in self.args.columns]
+        invalid = [column for column, key in zip(self.args.columns, keys) if len(key) != 2]
+
+        if invalid:
+            raise RuntimeException(
+                "Columns must be given as <unique_id>.<column>: {}".format(", ".join(invalid))
+            )
+
+        return keys
+
+    def read_exposures(self) -> Dict[str, List[str]]:
+        path = os.path.join(self.config.target_path, MANIFEST_FILE_NAME)
+
+        if not os.path.exists(path):
+            logger.warning("Manifest {} doesn't exist, exposures are omitted.".format(path))
+            return {}
+
+        manifest = WritableManifest.read(path)
+
+        return {
+            unique_id: exposure.depends_on.nodes
+            for unique_id, exposure in manifest.exposures.items()
+        }
+
+    def run(self) -> Dict[str, Any]:
+        self._runtime_initialize()
+
+        if self.lineage is None:
+            raise InternalException("Initially column lineage manifest must be created.")
+
+        closure = ColumnClosure.from_models(self.lineage.iter_models(), self.read_exposures())
+        keys = []
+        missing = []
+
+        for key in self.get_keys():
+            found = closure.find(key)
+
+            if found is None:
+                missing.append("{}.{}".format(*key))
+            else:
+                keys.append(found)
+
+        if missing:
+            raise RuntimeException("Columns aren't in lineage: {}".format(", ".join(missing)))
+
+        impact = {
+            "origins": _keys_to_dicts(closure.get_origins(keys)),
+            "affected": _keys_to_dicts(closure.get_affected(keys)),
+            "models": sorted(closure.get_affected_models(keys)),
+            "exposures": sorted(closure.get_affected_exposures(keys)),
+        }
+        sys.stdout.write(json.dumps(impact, indent=2) + "\n")
+
+        return impact
@@ -1,20 +1,74 @@
 import os.path
-from typing import Optional
+from typing import Optional, Union
 
-from dbt.clients.system import read_json
+from dbt.contracts.graph.manifest import Manifest
+from dbt.events import AdapterLogger
 from dbt.task.base import ConfiguredTask
-from dbt_column_lineage.dbt.paths import get_column_lineage_manifest_path
-from dbt_column_lineage.dbt.schemas.lineage import ModelsColumnsLineage
+from dbt.task.generate import CATALOG_FILENAME
+from dbt_column_lineage.dbt.paths import (
+    get_column_lineage_manifest_path,
+    get_column_lineage_timings_path,
+)
+from dbt_column_lineage.dbt.schemas.lineage import (
+    LazyModelsColumnsLineage,
+    LineageEncoding,
+    ModelsColumnsLineage,
+)
+from dbt_column_lineage.dbt.services.columns import ColumnResolution, ColumnsLookup
+from dbt_column_lineage.dbt.services.introspection import RelationIntrospector
+from dbt_column_lineage.dbt.services.lineage import LineageOptions
+from dbt_column_lineage.dbt.services.timings import Timings
+from dbt_column_lineage.parser.backends.base import ParserBackend
+from dbt_column_lineage.parser.budget import Budget
+from dbt_column_lineage.parser.services.template import TemplateCache
+
+logger = AdapterLogger("ColumnLineage")
 
 
 class LineageTask(ConfiguredTask):
     def __init__(self, args, config):
         super().__init__(args, config)
-        self.lineage: Optional[ModelsColumnsLineage] = None
+        self.lineage: Optional[Union[ModelsColumnsLineage, LazyModelsColumnsLineage]] = None
+        self.timings = Timings()
+        # created by tasks querying relation columns, closed by them at the end
+        self.introspector: Optional[RelationIntrospector] = None
+
+    def get_budget(self) -> Optional[Budget]:
+        seconds = getattr(self.args, "node_time_budget", None)
+        sql_size = getattr(self.args, "node_sql_size_budget", None)
+
+        if seconds is None and sql_size is None:
+            return None
+
+        return Budget(seconds=seconds, sql_size=sql_size)
+
+    def get_lineage_options(
+        self, backend: ParserBackend, templates: Optional[TemplateCache]
+    ) -> LineageOptions:
+        return LineageOptions(
+            timings=self.timings,
+            max_formula_length=self.args.max_formula_length,
+            backend=backend,
+            templates=templates,
+            budget=self.get_budget(),
+        )
+
+    def get_columns_lookup(
+        self, introspector: RelationIntrospector, manifest: Manifest
+    ) -> ColumnsLookup:
+        resolutions = map(ColumnResolution, self.args.column_resolution)
+        catalog_path = self.args.catalog or os.path.join(self.config.target_path, CATALOG_FILENAME)
+        return ColumnsLookup.from_manifest(introspector, manifest, resolutions, catalog_path)
+
+    def close_introspector(self):
+        if self.introspector:
+            self.introspector.close()
+            self.introspector = None
 
     def write_lineage(self):
         path = get_column_lineage_manifest_path(self.config)
-        self.lineage.write(path)
+        encoding = getattr(self.args, "manifest_encoding", None) or LineageEncoding.NESTED
+        self.lineage.write(path, LineageEncoding(encoding))
 
     def load_lineage(self):
         path = get_column_lineage_manifest_path(self.config)
@@ -22,8 +76,34 @@ class LineageTask(ConfiguredTask):
         if not os.path.exists(path):
             return
 
-        data = read_json(path)
-        self.lineage = ModelsColumnsLineage.from_dict(data)
+        self.lineage = LazyModelsColumnsLineage.read(path)
+
+    def write_timings(self):
+        slowest = self.args.timings_slowest
+        path = get_column_lineage_timings_path(self.config)
+        self.timings.write(path, slowest)
+
+        if self.args.log_timings:
+            self.timings.log_summary(slowest)
+
+    def save_lineage(self, lineage: ModelsColumnsLineage):
+        self.lineage = lineage
+
+        with self.timings.measure(None, "write_manifest"):
+            self.write_lineage()
+
+        self.write_timings()
+        self.log_skipped(lineage)
+
+    def log_skipped(self, lineage: ModelsColumnsLineage):
+        skipped = [model for model in lineage.models if model.skipped_reason]
+
+        if not skipped:
+            return
+
+        logger.warning("Lineage of {} models is skipped:".format(len(skipped)))
+        for model in skipped:
+            logger.warning("  {}: {}".format(model.name, model.skipped_reason))
 
     def _runtime_initialize(self):
         self.load_lineage()
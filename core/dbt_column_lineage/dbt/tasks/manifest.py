@@ -0,0 +1,93 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Union
+
+from dbt.adapters.factory import get_adapter
+from dbt.contracts.graph.compiled import CompiledModelNode, CompiledSeedNode
+from dbt.contracts.graph.manifest import WritableManifest
+from dbt.events import AdapterLogger
+from dbt.exceptions import RuntimeException
+from dbt.node_types import NodeType
+from dbt.task.runnable import MANIFEST_FILE_NAME
+from dbt_column_lineage.dbt.schemas.lineage import (
+    ModelColumnsLineage,
+    ModelsColumnsLineage,
+)
+from dbt_column_lineage.dbt.services.introspection import RelationIntrospector
+from dbt_column_lineage.dbt.services.lineage import (
+    get_model_columns_lineage,
+    prefetch_columns,
+)
+from dbt_column_lineage.dbt.tasks.lineage import LineageTask
+from dbt_column_lineage.parser.backends.registry import get_backend
+from dbt_column_lineage.parser.services.template import TemplateCache
+
+logger = AdapterLogger("ColumnLineage")
+
+
+class ParseManifestColumnLineageTask(LineageTask):
+    """Parse columns lineage of nodes compiled into an existing dbt manifest.
+
+    Neither the project is parsed and rendered, nor dbt runners are involved,
+    only relation introspection and lineage parsing are run.
+    """
+
+    def get_manifest_path(self) -> str:
+        return self.args.from_manifest or os.path.join(self.config.target_path, MANIFEST_FILE_NAME)
+
+    def read_manifest(self) -> WritableManifest:
+        path = self.get_manifest_path()
+
+        if not os.path.exists(path):
+            raise RuntimeException(
+                "Manifest {} doesn't exist, run `dbt compile` beforehand.".format(path)
+            )
+
+        return WritableManifest.read(path)
+
+    def get_nodes(
+        self, manifest: WritableManifest
+    ) -> List[Union[CompiledModelNode, CompiledSeedNode]]:
+        nodes = []
+
+        for node in manifest.nodes.values():
+            if node.resource_type not in (NodeType.Model, NodeType.Seed):
+                continue
+
+            if node.resource_type == NodeType.Model and not getattr(node, "compiled", False):
+                logger.warning("Model {} is not compiled, it's skipped.".format(node.unique_id))
+                continue
+
+            nodes.append(node)
+
+        return nodes
+
+    def run(self) -> ModelsColumnsLineage:
+        manifest = self.read_manifest()
+        nodes = self.get_nodes(manifest)
+
+        adapter = get_adapter(self.config)
+        backend = get_backend(self.args.parser_backend, adapter.type())
+        introspector = RelationIntrospector(
+            adapter, self.args.introspection_threads or self.config.threads
+        )
+        columns_lookup = self.get_columns_lookup(introspector, manifest)
+        templates = None if self.args.no_template_cache else TemplateCache()
+        options = self.get_lineage_options(backend, templates)
+
+        def get_columns_lineage(node) -> ModelColumnsLineage:
+            return get_model_columns_lineage(columns_lookup, manifest, node, options)
+
+        try:
+            prefetch_columns(columns_lookup, manifest, (node.unique_id for node in nodes))
+
+            with ThreadPoolExecutor(max_workers=self.config.threads) as executor:
+                models = list(executor.map(get_columns_lineage, nodes))
+        finally:
+            introspector.close()
+            adapter.cleanup_connections()
+
+        models_columns_lineage = ModelsColumnsLineage(models=models)
+        self.save_lineage(models_columns_lineage)
+
+        return models_columns_lineage
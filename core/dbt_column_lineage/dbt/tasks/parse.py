@@ -1,34 +1,64 @@
-from operator import attrgetter
+from typing import AbstractSet, Dict, List, Optional
 
+from dbt.contracts.graph.compiled import CompiledModelNode
 from dbt.exceptions import InternalException
 from dbt.graph import ResourceTypeSelector
 from dbt.node_types import NodeType
 from dbt.task.compile import CompileRunner, CompileTask
-from dbt_column_lineage.dbt.schemas.graph import ParsedColumnLineageNode
 from dbt_column_lineage.dbt.schemas.lineage import (
     ModelColumnsLineage,
     ModelsColumnsLineage,
 )
-from dbt_column_lineage.dbt.services.lineage import get_node_columns_lineage
+from dbt_column_lineage.dbt.services.columns import ColumnsLookup
+from dbt_column_lineage.dbt.services.introspection import RelationIntrospector
+from dbt_column_lineage.dbt.services.lineage import (
+    LineageOptions,
+    get_model_columns_lineage,
+    prefetch_columns,
+)
 from dbt_column_lineage.dbt.tasks.lineage import LineageTask
+from dbt_column_lineage.parser.backends.registry import get_backend
+from dbt_column_lineage.parser.services.template import TemplateCache
 
 
 class ParseColumnLineageRunner(CompileRunner):
+    # set by task
+    columns_lookup: ColumnsLookup
+    lineage_options: LineageOptions
+    # lineage of only these columns is resolved if set
+    columns: Optional[List[str]] = None
+    # lineage is carried alongside compiled nodes by their unique_id
+    models_columns_lineage: Dict[str, ModelColumnsLineage]
+
     # FIXME: compiled node order
-    def compile(self, manifest) -> ParsedColumnLineageNode:
-        node = super().compile(manifest)
+    def compile(self, manifest) -> CompiledModelNode:
+        measure = self.lineage_options.get_measure(self.node.unique_id)
 
-        columns_lineage = get_node_columns_lineage(self.adapter, manifest, node)
-        data = node.to_dict(omit_none=True)
-        data["columns_lineage"] = [
-            column_lineage.to_dict(omit_none=True) for column_lineage in columns_lineage
-        ]
-        node = ParsedColumnLineageNode.from_dict(data)
+        with measure("compile"):
+            node = super().compile(manifest)
+
+        self.models_columns_lineage[node.unique_id] = get_model_columns_lineage(
+            self.columns_lookup,
+            manifest,
+            node,
+            self.lineage_options,
+            self.columns,
+        )
 
         return node
 
 
 class ParseColumnLineageTask(CompileTask, LineageTask):
+    def __init__(self, args, config):
+        super().__init__(args, config)
+        self.columns_lookup: Optional[ColumnsLookup] = None
+        self.lineage_options: Optional[LineageOptions] = None
+        self.models_columns_lineage: Dict[str, ModelColumnsLineage] = {}
+        # models generated by one macro are resolved once
+        self.templates: Optional[TemplateCache] = (
+            None if args.no_template_cache else TemplateCache()
+        )
+
     def get_node_selector(self) -> ResourceTypeSelector:
         if self.manifest is None or self.graph is None:
             raise InternalException("manifest and graph must be set to get perform node selection")
@@ -42,19 +72,47 @@ class ParseColumnLineageTask(CompileTask, LineageTask):
     def get_runner_type(self, _):
         return ParseColumnLineageRunner
 
-    def run(self) -> ModelsColumnsLineage:
+    def get_runner(self, node) -> ParseColumnLineageRunner:
+        runner = super().get_runner(node)
+        runner.columns_lookup = self.columns_lookup
+        runner.lineage_options = self.lineage_options
+        runner.models_columns_lineage = self.models_columns_lineage
+        return runner
+
+    def before_run(self, adapter, selected_uids: AbstractSet[str]):
+        super().before_run(adapter, selected_uids)
+        backend = get_backend(self.args.parser_backend, adapter.type())
+        self.lineage_options = self.get_lineage_options(backend, self.templates)
+
+        # relation columns are kept between runs of a task
+        if self.introspector is None:
+            max_workers = self.args.introspection_threads or self.config.threads
+            self.introspector = RelationIntrospector(adapter, max_workers)
+
+        # declared columns are indexed by a manifest of a run
+        self.columns_lookup = self.get_columns_lookup(self.introspector, self.manifest)
+
+        # graph is known, so columns are fetched concurrently ahead of compilation
+        prefetch_columns(self.columns_lookup, self.manifest, selected_uids)
+
+    def parse_lineage(self) -> List[ModelColumnsLineage]:
         result = super().run()
-        nodes = map(attrgetter("node"), result.results)
-
-        models_columns_lineage = [
-            ModelColumnsLineage(
-                name=node.unique_id,
-                columns=node.columns_lineage,
-            )
-            for node in nodes
+        unique_ids = (node_result.node.unique_id for node_result in result.results)
+
+        # failed nodes don't have lineage
+        return [
+            self.models_columns_lineage[unique_id]
+            for unique_id in unique_ids
+            if unique_id in self.models_columns_lineage
         ]
-        models_columns_lineage = ModelsColumnsLineage(models=models_columns_lineage)
-        self.lineage = models_columns_lineage
-        self.write_lineage()
+
+    def run(self) -> ModelsColumnsLineage:
+        try:
+            models = self.parse_lineage()
+        finally:
+            self.close_introspector()
+
+        models_columns_lineage = ModelsColumnsLineage(models=models)
+        self.save_lineage(models_columns_lineage)
 
         return models_columns_lineage
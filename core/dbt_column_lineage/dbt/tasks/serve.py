@@ -0,0 +1,129 @@
+import copy
+import os
+import threading
+import time
+from typing import AbstractSet, List, Optional
+
+from dbt.events import AdapterLogger
+from dbt_column_lineage.dbt.schemas.lineage import ModelsColumnsLineage
+from dbt_column_lineage.dbt.services.index import LineageIndex
+from dbt_column_lineage.dbt.services.lineage import invalidate_columns
+from dbt_column_lineage.dbt.services.server import create_server
+from dbt_column_lineage.dbt.services.watch import SCHEMA_FILE_EXTENSIONS, FilesWatcher
+from dbt_column_lineage.dbt.tasks.lineage import LineageTask
+from dbt_column_lineage.dbt.tasks.parse import ParseColumnLineageTask
+from dbt_column_lineage.parser.services.template import TemplateCache
+
+logger = AdapterLogger("ColumnLineage")
+
+
+class RefreshLineageTask(ParseColumnLineageTask):
+    """Parse lineage of selected nodes once, with relation columns of previous refreshes."""
+
+    # set by serve task, relations don't change if only schema files do
+    invalidate = True
+
+    def before_run(self, adapter, selected_uids: AbstractSet[str]):
+        # columns changed nodes and their children are resolved from are queried again
+        if self.introspector is not None and self.invalidate:
+            invalidate_columns(self.introspector, self.manifest, selected_uids)
+
+        super().before_run(adapter, selected_uids)
+
+
+class ServeTask(LineageTask):
+    """Keep relation columns and lineage in memory and answer queries.
+
+    Files of models, seeds and schemas are polled, lineage of changed nodes and their children,
+    or of all selected nodes if a schema changed, is parsed again by a new refresh task
+    and merged into the index.
+    """
+
+    def __init__(self, args, config):
+        super().__init__(args, config)
+        self.index = LineageIndex()
+        self.templates: Optional[TemplateCache] = (
+            None if args.no_template_cache else TemplateCache()
+        )
+
+    def create_refresh_task(
+        self, select: Optional[List[str]], invalidate: bool = True
+    ) -> RefreshLineageTask:
+        # a graph runnable task is designed to run once
+        args = copy.copy(self.args)
+        args.select = select
+
+        task = RefreshLineageTask(args, self.config)
+        task.introspector = self.introspector
+        task.templates = self.templates
+        task.invalidate = invalidate
+        return task
+
+    def refresh_lineage(self, select: Optional[List[str]], invalidate: bool = True):
+        task = self.create_refresh_task(select, invalidate)
+
+        try:
+            models = task.parse_lineage()
+        finally:
+            # an introspector is created by the first refresh
+            self.introspector = task.introspector
+
+        self.index.update(models)
+        # lineage of removed nodes
+        self.index.retain(task.manifest.nodes)
+
+        task.save_lineage(ModelsColumnsLineage(models=self.index.models()))
+
+    def retain_existing(self):
+        task = self.create_refresh_task(None)
+        task.load_manifest()
+        self.index.retain(task.manifest.nodes)
+
+    def refresh_changed(self, paths: List[str]):
+        root = self.config.project_root
+        node_paths = [path for path in paths if not path.endswith(SCHEMA_FILE_EXTENSIONS)]
+        existing = [path for path in node_paths if os.path.exists(os.path.join(root, path))]
+        schema_changed = len(node_paths) != len(paths)
+        logger.info("Changed files: {}".format(", ".join(paths)))
+
+        try:
+            if schema_changed:
+                # columns of any node may be declared by a schema file, so all are parsed again
+                self.refresh_lineage(self.args.select, invalidate=bool(existing))
+            elif existing:
+                self.refresh_lineage(["path:{}+".format(path) for path in existing])
+            else:
+                # only removed files, nothing to parse
+                self.retain_existing()
+        except Exception as e:
+            # lineage parsed before is kept till files are fixed, parser errors included
+            logger.error("Lineage isn't refreshed: {}: {}".format(type(e).__name__, e))
+
+    def watch(self, watcher: FilesWatcher):
+        while True:
+            time.sleep(self.args.poll_interval)
+            paths = watcher.poll()
+
+            if paths:
+                self.refresh_changed(paths)
+
+    def run(self):
+        directories = [*self.config.model_paths, *self.config.seed_paths]
+        watcher = FilesWatcher(self.config.project_root, directories)
+
+        try:
+            self.refresh_lineage(self.args.select)
+
+            server = create_server(self.index, self.args.host, self.args.port, self.args.socket)
+            threading.Thread(target=server.serve_forever, daemon=True).start()
+            logger.info("Serving column lineage on {}".format(server.server_address))
+
+            try:
+                self.watch(watcher)
+            except KeyboardInterrupt:
+                pass
+            finally:
+                server.shutdown()
+                server.server_close()
+        finally:
+            self.close_introspector()
@@ -0,0 +1,15 @@
+from abc import ABC, abstractmethod
+from typing import Collection, List, Tuple
+
+from dbt_column_lineage.parser.schemas.parsed import CTE, Root
+
+
+class ParserBackend(ABC):
+    """SQL parser that turns compiled SQL into statements to resolve."""
+
+    name: str
+
+    @abstractmethod
+    def parse(self, sql: str, resolved_ctes: Collection[str] = ()) -> Tuple[Root, List[CTE]]:
+        """Parse SQL into the root and ctes, bodies of resolved ctes are skipped."""
+        raise NotImplementedError
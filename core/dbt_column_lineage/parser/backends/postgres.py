@@ -0,0 +1,14 @@
+from typing import Collection, List, Tuple
+
+from dbt_column_lineage.parser.backends.base import ParserBackend
+from dbt_column_lineage.parser.schemas.parsed import CTE, Root
+from dbt_column_lineage.parser.services.parse import parse
+
+
+class PglastBackend(ParserBackend):
+    """Backend based on the PostgreSQL parser."""
+
+    name = "pglast"
+
+    def parse(self, sql: str, resolved_ctes: Collection[str] = ()) -> Tuple[Root, List[CTE]]:
+        return parse(sql, resolved_ctes)
@@ -0,0 +1,37 @@
+from typing import Dict, Iterable, Optional, Type
+
+from dbt_column_lineage.parser.backends.base import ParserBackend
+from dbt_column_lineage.parser.backends.postgres import PglastBackend
+from dbt_column_lineage.parser.exceptions import BackendNotFoundException
+
+DEFAULT_BACKEND_NAME = PglastBackend.name
+
+_backends: Dict[str, Type[ParserBackend]] = {}
+_adapter_backends: Dict[str, str] = {}
+
+
+def register_backend(backend: Type[ParserBackend], adapter_types: Iterable[str] = ()):
+    _backends[backend.name] = backend
+
+    for adapter_type in adapter_types:
+        _adapter_backends[adapter_type] = backend.name
+
+
+def get_backend_names() -> Iterable[str]:
+    return _backends.keys()
+
+
+def get_backend(name: Optional[str] = None, adapter_type: Optional[str] = None) -> ParserBackend:
+    """Get backend by name or else by type of dbt adapter, pglast is used by default."""
+    if name is None:
+        name = _adapter_backends.get(adapter_type, DEFAULT_BACKEND_NAME)
+
+    backend = _backends.get(name)
+
+    if backend is None:
+        raise BackendNotFoundException("Parser backend {} is not registered.".format(name))
+
+    return backend()
+
+
+register_backend(PglastBackend, adapter_types=["postgres", "redshift"])
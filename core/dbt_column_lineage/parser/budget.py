@@ -0,0 +1,48 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Iterator, Optional
+
+from dbt_column_lineage.parser.exceptions import BudgetExceededException
+
+# deadline of SQL resolved by the current thread
+_deadline: ContextVar[Optional[float]] = ContextVar("deadline", default=None)
+
+
+@dataclass(frozen=True)
+class Budget:
+    """Limits of resolving lineage of one SQL statement."""
+
+    seconds: Optional[float] = None
+    # memory of parsed statements is proportional to size of SQL,
+    # so it's limited instead of memory which can't be measured per thread
+    sql_size: Optional[int] = None
+
+
+@contextmanager
+def spend(budget: Optional[Budget], sql: str) -> Iterator[None]:
+    if budget is None:
+        yield
+        return
+
+    if budget.sql_size is not None and len(sql) > budget.sql_size:
+        raise BudgetExceededException(
+            "SQL size {} exceeds budget of {} chars.".format(len(sql), budget.sql_size)
+        )
+
+    deadline = None if budget.seconds is None else time.monotonic() + budget.seconds
+    token = _deadline.set(deadline)
+
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def check_budget():
+    """Stop resolving if time is over, it's called by loops of parsing and resolving."""
+    deadline = _deadline.get()
+
+    if deadline is not None and time.monotonic() > deadline:
+        raise BudgetExceededException("Time budget is exceeded.")
@@ -8,3 +8,11 @@ class RootNotFoundException(Exception):
 
 class SourceReferenceNotFoundException(Exception):
     pass
+
+
+class BackendNotFoundException(Exception):
+    pass
+
+
+class BudgetExceededException(Exception):
+    pass
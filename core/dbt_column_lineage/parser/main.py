@@ -1,16 +1,143 @@
-from typing import Iterable
+from contextlib import nullcontext
+from typing import (
+    Callable,
+    Collection,
+    ContextManager,
+    FrozenSet,
+    Iterable,
+    Optional,
+    Sequence,
+)
 
+from dbt_column_lineage.parser.backends.base import ParserBackend
+from dbt_column_lineage.parser.backends.registry import get_backend
+from dbt_column_lineage.parser.budget import Budget, spend
 from dbt_column_lineage.parser.schemas.lineage import ColumnsLineage
+from dbt_column_lineage.parser.schemas.parsed import Root
 from dbt_column_lineage.parser.schemas.relation import Relation
+from dbt_column_lineage.parser.schemas.template import NormalizedSQL
 from dbt_column_lineage.parser.services.lineage import get_columns_lineage
-from dbt_column_lineage.parser.services.parse import parse
 from dbt_column_lineage.parser.services.resolve import resolve
+from dbt_column_lineage.parser.services.template import (
+    TemplateCache,
+    bind_template,
+    get_template,
+    get_template_key,
+    normalize_sql,
+)
 
+Measure = Callable[[str], ContextManager]
 
-def resolve_columns_lineage(sql: str, initial_relations: Iterable[Relation]) -> ColumnsLineage:
-    # TODO: parse adapter
-    root, ctes = parse(sql)
-    resolve(root, ctes, initial_relations)
-    columns_lineage = get_columns_lineage(root)
+
+def no_measure(stage: str) -> ContextManager:
+    return nullcontext()
+
+
+def _get_resolved_ctes(initial_relations: Iterable[Relation]) -> FrozenSet[str]:
+    # a relation named by an identifier only stands for a cte resolved before,
+    # e.g. an ephemeral model inlined by dbt
+    return frozenset(
+        relation.path.identifier
+        for relation in initial_relations
+        if relation.path.database is None and relation.path.schema is None
+    )
+
+
+def _resolve_root(
+    sql: str,
+    initial_relations: Sequence[Relation],
+    measure: Measure,
+    backend: ParserBackend,
+    columns: Optional[Collection[str]] = None,
+) -> Root:
+    with measure("parse"):
+        root, ctes = backend.parse(sql, _get_resolved_ctes(initial_relations))
+
+    with measure("resolve"):
+        resolve(root, ctes, initial_relations, columns)
+
+    return root
+
+
+def _resolve_columns_lineage_by_template(
+    normalized: NormalizedSQL,
+    initial_relations: Sequence[Relation],
+    measure: Measure,
+    max_formula_length: Optional[int],
+    backend: ParserBackend,
+    templates: TemplateCache,
+) -> ColumnsLineage:
+    key = get_template_key(normalized, backend.name)
+    template = templates.get(key)
+
+    if template is None:
+        root = _resolve_root(normalized.sql, normalized.relations, measure, backend)
+
+        with measure("get_columns_lineage"):
+            template = get_template(root, normalized.relations)
+
+        templates.set(key, template)
+
+    with measure("bind_template"):
+        return bind_template(template, normalized.values, initial_relations, max_formula_length)
+
+
+def _resolve_columns_lineage(
+    sql: str,
+    initial_relations: Sequence[Relation],
+    measure: Measure,
+    max_formula_length: Optional[int],
+    backend: ParserBackend,
+    templates: Optional[TemplateCache],
+    columns: Optional[Collection[str]],
+) -> ColumnsLineage:
+    # a template holds lineage of all columns
+    if templates is not None and columns is None:
+        with measure("normalize"):
+            normalized = normalize_sql(sql, initial_relations)
+
+        if normalized is not None:
+            return _resolve_columns_lineage_by_template(
+                normalized, initial_relations, measure, max_formula_length, backend, templates
+            )
+
+    root = _resolve_root(sql, initial_relations, measure, backend, columns)
+
+    with measure("get_columns_lineage"):
+        columns_lineage = get_columns_lineage(root, max_formula_length)
 
     return columns_lineage
+
+
+def resolve_columns_lineage(
+    sql: str,
+    initial_relations: Iterable[Relation],
+    measure: Measure = no_measure,
+    max_formula_length: Optional[int] = None,
+    backend: Optional[ParserBackend] = None,
+    templates: Optional[TemplateCache] = None,
+    budget: Optional[Budget] = None,
+    columns: Optional[Collection[str]] = None,
+) -> ColumnsLineage:
+    """Resolve lineage of columns of SQL.
+
+    If a template cache is passed, SQL that differs only in names of initial relations
+    and string literals from SQL resolved before is neither parsed nor resolved again.
+    BudgetExceededException is raised if SQL is out of budget.
+    If columns are passed, only lineage of those columns is resolved, their names are
+    matched case-insensitively.
+    An initial relation named by an identifier only replaces a cte of the same name,
+    which body isn't parsed.
+    """
+    backend = backend or get_backend()
+
+    with spend(budget, sql):
+        return _resolve_columns_lineage(
+            sql,
+            tuple(initial_relations),
+            measure,
+            max_formula_length,
+            backend,
+            templates,
+            columns,
+        )
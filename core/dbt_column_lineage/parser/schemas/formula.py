@@ -0,0 +1,143 @@
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+TRUNCATION_MARK = "..."
+
+
+class Formula:
+    """Formula of a field as literal parts of SQL interleaved with formulas of its arguments.
+
+    Arguments are formulas of upstream fields, so formulas of a chain of statements
+    share upstream subtrees instead of copying their text, the text is built only by `render`.
+    A formula of a column of a relation is a leaf marked by `is_column`.
+    """
+
+    __slots__ = ("parts", "args", "is_column")
+
+    def __init__(
+        self,
+        parts: Tuple[str, ...],
+        args: Tuple["Formula", ...] = (),
+        is_column: bool = False,
+    ):
+        if len(parts) != len(args) + 1:
+            raise ValueError("Number of parts must be greater than number of arguments by one.")
+
+        self.parts = parts
+        self.args = args
+        self.is_column = is_column
+
+    def render(self, max_length: Optional[int] = None) -> str:
+        # shared subtrees are rendered once, nodes are visited without recursion
+        # as chains of statements can be deeper than the recursion limit
+        rendered: Dict[int, str] = {}
+        stack: List[Tuple[Formula, bool]] = [(self, False)]
+
+        while stack:
+            formula, is_expanded = stack.pop()
+
+            if id(formula) in rendered:
+                continue
+
+            if not is_expanded:
+                stack.append((formula, True))
+                stack.extend((arg, False) for arg in formula.args if id(arg) not in rendered)
+                continue
+
+            rendered[id(formula)] = formula._join(rendered, max_length)
+
+        text = rendered[id(self)]
+
+        if max_length is not None and len(text) > max_length:
+            text = text[:max_length] + TRUNCATION_MARK
+
+        return text
+
+    def _join(self, rendered: Dict[int, str], max_length: Optional[int]) -> str:
+        pieces = [self.parts[0]]
+        for arg, part in zip(self.args, self.parts[1:]):
+            pieces.append(rendered[id(arg)])
+            pieces.append(part)
+
+        text = "".join(pieces)
+
+        # keep one extra char to know that text was truncated
+        if max_length is not None and len(text) > max_length:
+            text = text[: max_length + 1]
+
+        return text
+
+    def __repr__(self):
+        return "Formula({!r})".format(self.render(max_length=100))
+
+
+@dataclass(frozen=True)
+class FormulaTemplate:
+    """Formula of a field as written in SQL with column references cut out.
+
+    `positions` are indexes of field dependencies substituted between `parts`.
+    """
+
+    parts: Tuple[str, ...]
+    positions: Tuple[int, ...]
+
+    @property
+    def is_pass_through(self) -> bool:
+        return self.parts == ("", "")
+
+
+PASS_THROUGH = FormulaTemplate(parts=("", ""), positions=(0,))
+
+
+class FormulaFactory:
+    """Creates formulas, identical formulas are created once and shared (hash consing)."""
+
+    def __init__(self):
+        self._formulas: Dict[Tuple, Formula] = {}
+
+    def column(self, name: str) -> Formula:
+        return self._get((name,), (), is_column=True)
+
+    def bind(self, template: FormulaTemplate, args: Sequence[Formula]) -> Formula:
+        args = tuple(args[position] for position in template.positions)
+
+        # a field selected as is has a formula of its argument
+        if template.is_pass_through:
+            return args[0]
+
+        return self._get(template.parts, args)
+
+    def map_parts(self, formula: Formula, func: Callable[[str], str]) -> Formula:
+        """Create a formula with every literal part mapped, shared subtrees are mapped once."""
+        mapped: Dict[int, Formula] = {}
+        stack: List[Tuple[Formula, bool]] = [(formula, False)]
+
+        while stack:
+            formula_, is_expanded = stack.pop()
+
+            if id(formula_) in mapped:
+                continue
+
+            if not is_expanded:
+                stack.append((formula_, True))
+                stack.extend((arg, False) for arg in formula_.args if id(arg) not in mapped)
+                continue
+
+            parts = tuple(map(func, formula_.parts))
+            args = tuple(mapped[id(arg)] for arg in formula_.args)
+            mapped[id(formula_)] = self._get(parts, args, formula_.is_column)
+
+        return mapped[id(formula)]
+
+    def _get(
+        self, parts: Tuple[str, ...], args: Tuple[Formula, ...], is_column: bool = False
+    ) -> Formula:
+        # arguments are already unique, so they are compared by identity
+        key = (parts, tuple(map(id, args)), is_column)
+        formula = self._formulas.get(key)
+
+        if formula is None:
+            formula = Formula(parts=parts, args=args, is_column=is_column)
+            self._formulas[key] = formula
+
+        return formula
@@ -1,8 +1,13 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from functools import cached_property
-from typing import List, Optional, Union
+from typing import Callable, Dict, List, Optional, Union
 
 from dbt_column_lineage.parser.schemas.base import FieldSearchMixin
+from dbt_column_lineage.parser.schemas.formula import (
+    PASS_THROUGH,
+    Formula,
+    FormulaTemplate,
+)
 from dbt_column_lineage.parser.schemas.relation import Path, Relation
 from dbt_column_lineage.parser.schemas.token import TokenList
 
@@ -43,7 +48,20 @@ class Field:
     depends_on: List[FieldRef]
     alias: Optional[str] = None
 
-    formula: Optional[str] = None
+    template: Optional[FormulaTemplate] = None
+    # a template is built on demand, formulas of only some fields may be needed
+    build_template: Optional[Callable[[], FormulaTemplate]] = field(
+        default=None, repr=False, compare=False
+    )
+
+    # resolved
+    formula: Optional[Formula] = None
+
+    def get_template(self) -> FormulaTemplate:
+        if self.template is None:
+            self.template = self.build_template()
+
+        return self.template
 
     @cached_property
     def name(self) -> str:
@@ -61,6 +79,15 @@ class Field:
     def is_a_star(self) -> bool:
         return self.name == A_Star
 
+    @classmethod
+    def from_source(cls, source: "Source", name: str) -> "Field":
+        # field selected from a source as is, path of a source is shared
+        return cls(
+            depends_on=[FieldRef(path=source.search_path, name=name, source=source)],
+            alias=name,
+            template=PASS_THROUGH,
+        )
+
 
 @dataclass
 class Source:
@@ -85,12 +112,23 @@ class Statement(FieldSearchMixin):
     fields: List[Field]
     sources: List[Source]
 
-    # TODO: get by index ?
+    _fields_map: Optional[Dict[str, Field]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def set_fields(self, fields: List[Field]):
+        self.fields = fields
+        self._fields_map = None
+
     def get_field(self, name: str) -> Optional[Field]:
-        for field_ in self.fields:
-            if field_.name == name:
-                return field_
-        return None
+        if self._fields_map is None:
+            self._fields_map = {}
+
+            # the first field wins as by search in order
+            for field_ in self.fields:
+                self._fields_map.setdefault(field_.name, field_)
+
+        return self._fields_map.get(name)
 
     def has_field(self, name: str) -> bool:
         return bool(self.get_field(name))
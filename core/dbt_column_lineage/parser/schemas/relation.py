@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 from enum import Enum
 from functools import cached_property
-from typing import Optional, Tuple
+from typing import FrozenSet, Optional, Tuple
 
 from dbt_column_lineage.parser.schemas.base import FieldSearchMixin
 
@@ -62,8 +62,12 @@ class Relation(FieldSearchMixin):
     path: Path
     field_names: Tuple[str, ...]
 
+    @cached_property
+    def field_names_set(self) -> FrozenSet[str]:
+        return frozenset(self.field_names)
+
     def has_field(self, name: str) -> bool:
-        return name in self.field_names
+        return name in self.field_names_set
 
 
 empty_path = Path()
@@ -0,0 +1,28 @@
+from dataclasses import dataclass
+from typing import Tuple
+
+from dbt_column_lineage.parser.schemas.formula import Formula
+from dbt_column_lineage.parser.schemas.relation import Relation
+
+
+@dataclass(frozen=True)
+class NormalizedSQL:
+    """SQL with literals and names of relations replaced by numbered placeholders."""
+
+    sql: str
+    # original text of every placeholder
+    values: Tuple[str, ...]
+    # initial relations with paths of placeholders if their names were replaced
+    relations: Tuple[Relation, ...]
+
+
+@dataclass(frozen=True)
+class ColumnTemplate:
+    name: str
+    # literal parts contain placeholders
+    formula: Formula
+    # indexes of initial relations with names of their columns
+    lineage: Tuple[Tuple[int, Tuple[str, ...]], ...]
+
+
+LineageTemplate = Tuple[ColumnTemplate, ...]
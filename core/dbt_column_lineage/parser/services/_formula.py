@@ -1,6 +1,8 @@
 import copy
 from typing import List
 
+from dbt_column_lineage.parser.budget import check_budget
+from dbt_column_lineage.parser.schemas.formula import FormulaTemplate
 from dbt_column_lineage.parser.schemas.parsed import NodeSQL
 from dbt_column_lineage.parser.schemas.token import TokenList
 from pglast.ast import ColumnRef
@@ -22,12 +24,14 @@ def get_field_def(tokens: TokenList) -> TokenList:
     return tokens
 
 
-def get_formula(node_sql: NodeSQL, column_refs: List[ColumnRef]) -> str:
+def get_formula(node_sql: NodeSQL, column_refs: List[ColumnRef]) -> FormulaTemplate:
     formula_tokens = get_field_def(node_sql.tokens_area)
     exclude = []
 
     # fill in exclude list (bounds of column_ref)
     for i, column_ref in enumerate(column_refs):
+        check_budget()
+
         start_idx = column_ref.location
         end_idx = None
 
@@ -53,13 +57,14 @@ def get_formula(node_sql: NodeSQL, column_refs: List[ColumnRef]) -> str:
     formula_bounds = (formula_tokens[0].start, formula_tokens[-1].end)
     prev_end_idx = formula_bounds[0]
     parts = []
+    positions = []
 
-    # format original formula: replace column_refs with {pos}
+    # cut column_refs out of original formula
     for pos, start_idx, end_idx in exclude:
         parts.append(node_sql.sql[prev_end_idx:start_idx])
-        parts.append("{%s}" % (pos,))
+        positions.append(pos)
         prev_end_idx = end_idx + 1
 
     parts.append(node_sql.sql[prev_end_idx : formula_bounds[1] + 1])
 
-    return "".join(parts)
+    return FormulaTemplate(parts=tuple(parts), positions=tuple(positions))
@@ -1,16 +1,18 @@
 from collections import defaultdict
+from typing import Dict, List, Optional
 
+from dbt_column_lineage.parser.budget import check_budget
 from dbt_column_lineage.parser.schemas.lineage import ColumnLineage, ColumnsLineage
 from dbt_column_lineage.parser.schemas.parsed import Field, Root
 from dbt_column_lineage.parser.schemas.relation import Relation
 
 
-def get_column_lineage(field: Field) -> ColumnLineage:
+def get_field_lineage(field: Field) -> Dict[Relation, List[str]]:
     stack = [field]
-    formula = field.formula
     lineage = defaultdict(list)
 
     while len(stack) != 0:
+        check_budget()
         field = stack.pop()
 
         for field_ref in field.depends_on:
@@ -31,14 +33,22 @@ def get_column_lineage(field: Field) -> ColumnLineage:
 
             stack.append(field_)
 
-    res = ColumnLineage(formula=formula, lineage=lineage)
+    return lineage
+
+
+def get_column_lineage(field: Field, max_formula_length: Optional[int] = None) -> ColumnLineage:
+    # a field selected as is, renamed or through ctes as well, doesn't have a formula
+    formula = "" if field.formula.is_column else field.formula.render(max_formula_length)
+    res = ColumnLineage(formula=formula, lineage=get_field_lineage(field))
 
     return res
 
 
-def get_columns_lineage(root: Root) -> ColumnsLineage:
+def get_columns_lineage(root: Root, max_formula_length: Optional[int] = None) -> ColumnsLineage:
     res = {}
     for field in root.fields:
-        res[field.name] = get_column_lineage(field)
+        check_budget()
+
+        res[field.name] = get_column_lineage(field, max_formula_length)
 
     return res
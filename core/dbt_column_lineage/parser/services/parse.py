@@ -1,6 +1,8 @@
+from functools import partial
 from operator import attrgetter
-from typing import List, Tuple
+from typing import Collection, Dict, List, Tuple
 
+from dbt_column_lineage.parser.budget import check_budget
 from dbt_column_lineage.parser.exceptions import RootNotFoundException
 from dbt_column_lineage.parser.schemas.parsed import (
     CTE,
@@ -47,27 +49,30 @@ def get_field_ref(node: ColumnRef) -> FieldRef:
 def get_field(node: ResTarget, node_sql: NodeSQL) -> Field:
     column_refs = ColumnRefVisitor()(node)
     field_refs = list(map(get_field_ref, column_refs))
-    formula = get_formula(node_sql, column_refs)
+    build_template = partial(get_formula, node_sql, column_refs)
 
-    return Field(alias=node.name, depends_on=field_refs, formula=formula)
+    return Field(alias=node.name, depends_on=field_refs, build_template=build_template)
 
 
 def get_fields(node: Node, node_sql: NodeSQL) -> List[Field]:
     targets = ResTargetVisitor()(node)
 
-    bounds = list(map(attrgetter("location"), targets))
+    # a field ends right before the next one
+    bounds = [target.location - 1 for target in targets[1:]]
     bounds.append(node_sql.end_idx)
 
     fields = []
 
     for i, target in enumerate(targets):
+        check_budget()
+
         cte = get_field(
             target,
             NodeSQL(
                 sql=node_sql.sql,
                 tokens=node_sql.tokens,
-                start_idx=bounds[i],
-                end_idx=bounds[i + 1],
+                start_idx=target.location,
+                end_idx=bounds[i],
             ),
         )
 
@@ -130,16 +135,21 @@ def get_cte(node: CommonTableExpr, node_sql: NodeSQL) -> CTE:
     )
 
 
-def get_ctes(node: SelectStmt, node_sql: NodeSQL) -> List[CTE]:
+def get_ctes(
+    node: SelectStmt, node_sql: NodeSQL, root: Root, resolved_ctes: Collection[str] = ()
+) -> List[CTE]:
+    """Get ctes reachable from the root, bodies of the others aren't analysed.
+
+    Resolved ctes are referenced as relations, so they aren't analysed either.
+    """
     cte_exprs = CommonTableExprVisitor(flat=True)(node.withClause)
 
     location_idxs = list(map(attrgetter("location"), cte_exprs))
     location_idxs.append(node_sql.end_idx)
 
-    ctes = []
-
-    for i, cte_expr in enumerate(cte_exprs):
-        cte = get_cte(
+    # a cte is known by its name and bounds till it's referenced
+    cte_bounds: Dict[str, Tuple[CommonTableExpr, NodeSQL]] = {
+        cte_expr.ctename: (
             cte_expr,
             NodeSQL(
                 sql=node_sql.sql,
@@ -148,8 +158,27 @@ def get_ctes(node: SelectStmt, node_sql: NodeSQL) -> List[CTE]:
                 end_idx=location_idxs[i + 1],
             ),
         )
+        for i, cte_expr in enumerate(cte_exprs)
+        if cte_expr.ctename not in resolved_ctes
+    }
+
+    ctes = []
+    statements: List[Statement] = [root]
+
+    while statements:
+        statement = statements.pop()
+
+        for source in statement.sources:
+            bounds = cte_bounds.pop(source.path.identifier, None)
+
+            if bounds is None:
+                continue
+
+            check_budget()
+            cte = get_cte(*bounds)
 
-        ctes.append(cte)
+            ctes.append(cte)
+            statements.append(cte)
 
     return ctes
 
@@ -214,7 +243,7 @@ def get_ctes_end_idx(node: SelectStmt, tokens: TokenList) -> int:
     raise Exception("Invalid parenthesis sequence.")
 
 
-def parse(sql: str) -> Tuple[Root, List[CTE]]:
+def parse(sql: str, resolved_ctes: Collection[str] = ()) -> Tuple[Root, List[CTE]]:
     sql = remove_comments(sql)
     parsed_sql = parse_sql(sql)
 
@@ -250,6 +279,8 @@ def parse(sql: str) -> Tuple[Root, List[CTE]]:
             # TODO: remove spaces ?
             end_idx=ctes_end_idx,
         ),
+        root,
+        resolved_ctes,
     )
 
     return root, ctes
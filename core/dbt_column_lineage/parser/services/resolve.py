@@ -1,12 +1,13 @@
-from dataclasses import replace
 from operator import attrgetter
-from typing import Dict, Iterable, List, Union
+from typing import Collection, Dict, Iterable, List, Optional, Set, Tuple, Union
 
 import networkx as nx
+from dbt_column_lineage.parser.budget import check_budget
 from dbt_column_lineage.parser.exceptions import (
     SourceNotFoundException,
     SourceReferenceNotFoundException,
 )
+from dbt_column_lineage.parser.schemas.formula import FormulaFactory
 from dbt_column_lineage.parser.schemas.parsed import (
     CTE,
     Field,
@@ -66,8 +67,9 @@ class StatementsSorter:
         return self.sort_statements()
 
     def sort_statements(self) -> Iterable[Statement]:
-        # build dag
+        # build dag, the root is resolved even if it doesn't reference ctes
         dag = nx.DiGraph()
+        dag.add_node(self.root_name)
 
         for statement in self.statements:
             references = map(attrgetter("reference"), statement.sources)
@@ -88,22 +90,35 @@ class StatementsSorter:
 
 
 class FieldResolver:
+    def __init__(self, formulas: FormulaFactory):
+        self.formulas = formulas
+
     def __call__(self, statement: Statement):
+        self.set_statement(statement)
+
+        self.resolve_normal_fields()
+        self.resolve_a_star_fields()
+        self.resolve_formulas(self.statement.fields)
+
+    def set_statement(self, statement: Statement):
         self.statement = statement
         self.source_map: Dict[Path, Source] = {
             source.search_path: source for source in statement.sources
         }
 
-        self.resolve_normal_fields()
-        self.resolve_a_star_fields()
-        self.resolve_formulas()
-
     def resolve_a_star_fields(self):
-        fields = filter(attrgetter("is_a_star"), self.statement.fields)
+        # one pass, a star is replaced by fields of its sources in place
+        fields = []
 
-        for field in fields:
-            self.statement.fields.remove(field)
-            self.statement.fields.extend(self.get_a_star_fields(field))
+        for field in self.statement.fields:
+            check_budget()
+
+            if field.is_a_star:
+                fields.extend(self.get_a_star_fields(field))
+            else:
+                fields.append(field)
+
+        self.statement.set_fields(fields)
 
     def get_a_star_fields(self, field: Field) -> List[Field]:
         sources = (
@@ -119,21 +134,7 @@ class FieldResolver:
                 if isinstance(source.reference, Relation)
                 else map(attrgetter("name"), source.reference.fields)
             )
-            fields.extend(
-                [
-                    Field(
-                        depends_on=[
-                            FieldRef(
-                                path=replace(source.search_path),
-                                name=field_name,
-                                source=source,
-                            ),
-                        ],
-                        formula="{}",
-                    )
-                    for field_name in field_names
-                ]
-            )
+            fields.extend(Field.from_source(source, field_name) for field_name in field_names)
 
         return fields
 
@@ -141,7 +142,12 @@ class FieldResolver:
         fields = filter(lambda f: not f.is_a_star, self.statement.fields)
 
         for field in fields:
-            for field_ref in field.depends_on:
+            check_budget()
+            self.resolve_field_refs(field)
+
+    def resolve_field_refs(self, field: Field):
+        for field_ref in field.depends_on:
+            if field_ref.source is None:
                 field_ref.source = self.get_field_ref_source(field_ref)
 
     def get_field_ref_source(self, field_ref: FieldRef) -> Source:
@@ -154,37 +160,114 @@ class FieldResolver:
 
         raise SourceNotFoundException()
 
-    def resolve_formulas(self):
-        for field in self.statement.fields:
-            formulas = []
+    def resolve_formulas(self, fields: Iterable[Field]):
+        for field in fields:
+            check_budget()
+            args = []
 
             for field_ref in field.depends_on:
                 reference = field_ref.source.reference
 
                 if isinstance(reference, Relation):
-                    formulas.append(field_ref.name)
+                    args.append(self.formulas.column(field_ref.name))
                     continue
 
                 field_ = reference.get_field(field_ref.name)
-                formulas.append(field_.formula)
+                args.append(field_.formula)
 
-            field.formula = field.formula.format(*formulas)
-            if len(field.depends_on) == 1 and field.formula == str(field.depends_on[0]):
-                field.formula = ""
+            field.formula = self.formulas.bind(field.get_template(), args)
 
 
 class FieldsResolver:
     def __init__(self):
-        self.field_resolver = FieldResolver()
+        self.field_resolver = FieldResolver(FormulaFactory())
 
     def __call__(self, statements: Iterable[Statement]):
         for statement in statements:
             self.field_resolver(statement)
 
 
-def resolve(root: Root, ctes: List[CTE], initial_relations: Iterable[Relation]):
+class ColumnsResolver:
+    """Resolves only fields which the given columns of a root depend on.
+
+    Stars are expanded everywhere, as names of fields are needed to find sources,
+    but sources and formulas are resolved for required fields only.
+    """
+
+    def __init__(self, columns: Collection[str]):
+        # unquoted names are folded by SQL and by warehouses differently, e.g. names of
+        # expanded stars are upper case on Snowflake, so they're matched case-insensitively
+        self.columns = {column.lower() for column in columns}
+        self.formulas = FormulaFactory()
+        self.field_resolvers: Dict[int, FieldResolver] = {}
+
+    def __call__(self, root: Root, statements: Iterable[Statement]):
+        statements = list(statements)
+
+        for statement in statements:
+            self.get_field_resolver(statement).resolve_a_star_fields()
+
+        root.set_fields([field for field in root.fields if field.name.lower() in self.columns])
+        required = self.get_required_fields(root)
+
+        for statement in statements:
+            fields = [field for field in statement.fields if id(field) in required]
+            self.get_field_resolver(statement).resolve_formulas(fields)
+
+    def get_field_resolver(self, statement: Statement) -> FieldResolver:
+        field_resolver = self.field_resolvers.get(id(statement))
+
+        if field_resolver is None:
+            field_resolver = FieldResolver(self.formulas)
+            field_resolver.set_statement(statement)
+            self.field_resolvers[id(statement)] = field_resolver
+
+        return field_resolver
+
+    def get_required_fields(self, root: Root) -> Set[int]:
+        # walk back from fields of the root through fields of ctes
+        required: Set[int] = set()
+        stack: List[Tuple[Statement, Field]] = [(root, field) for field in root.fields]
+
+        while stack:
+            check_budget()
+            statement, field = stack.pop()
+
+            if id(field) in required:
+                continue
+
+            required.add(id(field))
+            self.get_field_resolver(statement).resolve_field_refs(field)
+
+            for field_ref in field.depends_on:
+                reference = field_ref.source.reference
+                field_ = (
+                    None if isinstance(reference, Relation) else reference.get_field(field_ref.name)
+                )
+
+                if field_ is not None:
+                    stack.append((reference, field_))
+
+        return required
+
+
+def resolve(
+    root: Root,
+    ctes: List[CTE],
+    initial_relations: Iterable[Relation],
+    columns: Optional[Collection[str]] = None,
+):
+    """Resolve sources, fields and formulas of statements.
+
+    If columns are passed, the root keeps only fields of those columns, matched
+    case-insensitively, and only fields they depend on are resolved.
+    """
     statements = [root, *ctes]
 
     SourcesResolver()(initial_relations, statements)
     statements = StatementsSorter()(statements)
-    FieldsResolver()(statements)
+
+    if columns is None:
+        FieldsResolver()(statements)
+    else:
+        ColumnsResolver(columns)(root, statements)
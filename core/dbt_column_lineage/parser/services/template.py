@@ -0,0 +1,246 @@
+import hashlib
+import re
+import threading
+from typing import Dict, List, Match, Optional, Sequence, Tuple
+
+from dbt_column_lineage.parser.budget import check_budget
+from dbt_column_lineage.parser.schemas.formula import FormulaFactory
+from dbt_column_lineage.parser.schemas.lineage import ColumnLineage, ColumnsLineage
+from dbt_column_lineage.parser.schemas.parsed import Root
+from dbt_column_lineage.parser.schemas.relation import ComponentName, Path, Relation
+from dbt_column_lineage.parser.schemas.template import (
+    ColumnTemplate,
+    LineageTemplate,
+    NormalizedSQL,
+)
+from dbt_column_lineage.parser.services.lineage import get_field_lineage
+from dbt_column_lineage.parser.services.parse import remove_comments
+from pglast.parser import Token, scan
+
+PLACEHOLDER_PREFIX = "__column_lineage_"
+RELATION_PLACEHOLDER = PLACEHOLDER_PREFIX + "{}__"
+LITERAL_PLACEHOLDER = "'" + RELATION_PLACEHOLDER + "'"
+PLACEHOLDER_PATTERN = re.compile(r"'__column_lineage_(\d+)__'|__column_lineage_(\d+)__")
+
+# string literals can be replaced by another one anywhere, while numbers can't,
+# e.g. in type modifiers
+LITERAL_TOKENS = frozenset(("SCONST", "BCONST", "XCONST"))
+DOT_TOKEN = "ASCII_46"
+
+# templates kept by a cache, the least recently used one is dropped beyond it
+TEMPLATE_CACHE_SIZE = 4096
+
+
+def _get_components(path: Path) -> Tuple[str, ...]:
+    return tuple(filter(None, map(path.get_part, ComponentName)))
+
+
+class _Normalizer:
+    def __init__(self, sql: str, relations: Sequence[Relation]):
+        self.sql = sql
+        self.tokens: List[Token] = scan(sql)
+        # a single identifier may be an alias or a column as well
+        self.paths: Dict[Tuple[str, ...], int] = {
+            components: i
+            for i, components in enumerate(_get_components(r.path) for r in relations)
+            if len(components) > 1
+        }
+        self.relations = relations
+        self.relation_values: Dict[int, int] = {}
+        self.values: List[str] = []
+        self.pieces: List[str] = []
+        self.end_idx = 0
+
+    def get_name(self, token: Token) -> Optional[str]:
+        if token.name != "IDENT" and token.kind == "NO_KEYWORD":
+            return None
+
+        text = self.sql[token.start : token.end + 1]
+
+        if text.startswith('"'):
+            return text[1:-1].replace('""', '"')
+
+        return text.lower()
+
+    def match_relation(self, i: int) -> Optional[Tuple[int, int]]:
+        # dotted names are matched from their start only
+        if i > 0 and self.tokens[i - 1].name == DOT_TOKEN:
+            return None
+
+        components: Tuple[str, ...] = ()
+
+        for j in range(i, min(i + 5, len(self.tokens)), 2):
+            name = self.get_name(self.tokens[j])
+
+            if name is None:
+                return None
+
+            components += (name,)
+            relation_idx = self.paths.get(components)
+
+            if relation_idx is not None:
+                return j, relation_idx
+
+            if j + 1 == len(self.tokens) or self.tokens[j + 1].name != DOT_TOKEN:
+                return None
+
+        return None
+
+    def replace(self, start_token: Token, end_token: Token, placeholder: str):
+        self.pieces.append(self.sql[self.end_idx : start_token.start])
+        self.pieces.append(placeholder)
+        self.end_idx = end_token.end + 1
+
+    def add_value(self, start_token: Token, end_token: Token) -> int:
+        self.values.append(self.sql[start_token.start : end_token.end + 1])
+        return len(self.values) - 1
+
+    def replace_relation(self, i: int, j: int, relation_idx: int):
+        value_idx = self.relation_values.get(relation_idx)
+
+        if value_idx is None:
+            value_idx = self.add_value(self.tokens[i], self.tokens[j])
+            self.relation_values[relation_idx] = value_idx
+
+        self.replace(self.tokens[i], self.tokens[j], RELATION_PLACEHOLDER.format(value_idx))
+
+    def __call__(self) -> NormalizedSQL:
+        i = 0
+
+        while i < len(self.tokens):
+            token = self.tokens[i]
+            match = None if token.name in LITERAL_TOKENS else self.match_relation(i)
+
+            if match:
+                self.replace_relation(i, *match)
+                i = match[0]
+            elif token.name in LITERAL_TOKENS:
+                self.replace(token, token, LITERAL_PLACEHOLDER.format(self.add_value(token, token)))
+
+            i += 1
+
+        self.pieces.append(self.sql[self.end_idx :])
+
+        return NormalizedSQL(
+            sql="".join(self.pieces),
+            values=tuple(self.values),
+            relations=tuple(self.get_relations()),
+        )
+
+    def get_relations(self) -> List[Relation]:
+        relations = list(self.relations)
+
+        for relation_idx, value_idx in self.relation_values.items():
+            path = Path(identifier=RELATION_PLACEHOLDER.format(value_idx))
+            relations[relation_idx] = Relation(
+                path=path, field_names=relations[relation_idx].field_names
+            )
+
+        return relations
+
+
+def normalize_sql(sql: str, relations: Sequence[Relation]) -> Optional[NormalizedSQL]:
+    """Replace string literals and names of relations, so SQL of models generated
+    by one macro is the same. None is returned if SQL can't be normalized unambiguously.
+    """
+    if PLACEHOLDER_PREFIX in sql:
+        return None
+
+    return _Normalizer(remove_comments(sql), relations)()
+
+
+def get_template_key(normalized: NormalizedSQL, backend_name: str) -> str:
+    # columns of relations are a part of a key, as stars are expanded by them
+    key = repr(
+        (
+            backend_name,
+            normalized.sql,
+            [(relation.path, relation.field_names) for relation in normalized.relations],
+        )
+    )
+    return hashlib.sha256(key.encode()).hexdigest()
+
+
+def get_template(root: Root, relations: Sequence[Relation]) -> LineageTemplate:
+    relation_idxs = {relation: i for i, relation in enumerate(relations)}
+
+    return tuple(
+        ColumnTemplate(
+            name=field.name,
+            formula=field.formula,
+            lineage=tuple(
+                (relation_idxs[relation], tuple(columns))
+                for relation, columns in get_field_lineage(field).items()
+            ),
+        )
+        for field in root.fields
+    )
+
+
+def bind_template(
+    template: LineageTemplate,
+    values: Sequence[str],
+    relations: Sequence[Relation],
+    max_formula_length: Optional[int] = None,
+) -> ColumnsLineage:
+    formulas = FormulaFactory()
+
+    def substitute(match: Match) -> str:
+        return values[int(match.group(1) or match.group(2))]
+
+    def substitute_part(part: str) -> str:
+        return PLACEHOLDER_PATTERN.sub(substitute, part) if PLACEHOLDER_PREFIX in part else part
+
+    res = {}
+
+    for column in template:
+        check_budget()
+
+        formula = (
+            ""
+            if column.formula.is_column
+            else formulas.map_parts(column.formula, substitute_part).render(max_formula_length)
+        )
+
+        res[column.name] = ColumnLineage(
+            formula=formula,
+            lineage={relations[i]: list(columns) for i, columns in column.lineage},
+        )
+
+    return res
+
+
+class TemplateCache:
+    """Lineage templates by fingerprints of normalized SQL, shared by threads of a run.
+
+    A cache is bounded, so it can live as long as a process, e.g. of a served lineage.
+    """
+
+    def __init__(self, size: int = TEMPLATE_CACHE_SIZE):
+        self.size = size
+        self._lock = threading.Lock()
+        self._templates: Dict[str, LineageTemplate] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Optional[LineageTemplate]:
+        with self._lock:
+            template = self._templates.pop(key, None)
+
+            if template is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                # dicts keep insertion order, so the last one is the most recently used
+                self._templates[key] = template
+
+            return template
+
+    def set(self, key: str, template: LineageTemplate):
+        with self._lock:
+            self._templates.pop(key, None)
+
+            if len(self._templates) >= self.size:
+                del self._templates[next(iter(self._templates))]
+
+            self._templates[key] = template
@@ -0,0 +1,128 @@
+import unittest
+
+from dbt_column_lineage.dbt.schemas.lineage import (
+    ColumnLineage,
+    ModelColumnsLineage,
+    Source,
+)
+from dbt_column_lineage.dbt.services.closure import ColumnClosure
+
+
+def _column(name: str, *sources: str) -> ColumnLineage:
+    # sources are given as <model>.<column>
+    columns_by_model = {}
+    for source in sources:
+        model, column = source.split(".")
+        columns_by_model.setdefault(model, []).append(column)
+
+    return ColumnLineage(
+        name=name,
+        sources=[
+            Source(name=model, columns=columns) for model, columns in columns_by_model.items()
+        ],
+    )
+
+
+# users and orders are seeds, customers join them, reports are built on customers
+MODELS = [
+    ModelColumnsLineage(name="reports", columns=[_column("contact", "customers.email")]),
+    ModelColumnsLineage(
+        name="customers",
+        columns=[
+            _column("id", "users.id"),
+            _column("email", "users.email"),
+            _column("spent", "orders.amount", "users.id"),
+        ],
+    ),
+    ModelColumnsLineage(
+        name="users", columns=[ColumnLineage(name="id"), ColumnLineage(name="email")]
+    ),
+    ModelColumnsLineage(name="orders", columns=[ColumnLineage(name="amount")]),
+    ModelColumnsLineage(name="totals", columns=[_column("total", "customers.spent")]),
+]
+
+EXPOSURES = {
+    "exposure.crm": ["reports"],
+    "exposure.finance": ["totals"],
+    "exposure.users": ["users"],
+}
+
+
+class TestColumnClosure(unittest.TestCase):
+    def setUp(self):
+        self.closure = ColumnClosure.from_models(MODELS, EXPOSURES)
+
+    def test_get_origins(self):
+        self.assertEqual(
+            set(self.closure.get_origins([("totals", "total")])),
+            {("orders", "amount"), ("users", "id")},
+        )
+
+    def test_get_origins_of_many_columns(self):
+        self.assertEqual(
+            set(self.closure.get_origins([("reports", "contact"), ("customers", "id")])),
+            {("users", "email"), ("users", "id")},
+        )
+
+    def test_get_origins_of_origin(self):
+        self.assertEqual(self.closure.get_origins([("users", "email")]), [])
+
+    def test_get_affected_models(self):
+        self.assertEqual(
+            self.closure.get_affected_models([("users", "email")]), {"customers", "reports"}
+        )
+
+    def test_get_affected_models_of_many_columns(self):
+        self.assertEqual(
+            self.closure.get_affected_models([("users", "email"), ("orders", "amount")]),
+            {"customers", "reports", "totals"},
+        )
+
+    def test_get_affected_models_of_leaf(self):
+        self.assertEqual(self.closure.get_affected_models([("totals", "total")]), set())
+
+    def test_cached_closure_is_reused(self):
+        # a cached closure of customers.spent is united into a closure of users.id
+        self.assertEqual(self.closure.get_downstream(("customers", "spent")), [("totals", "total")])
+        self.assertEqual(
+            set(self.closure.get_downstream(("users", "id"))),
+            {("customers", "id"), ("customers", "spent"), ("totals", "total")},
+        )
+
+    def test_columns_are_in_lineage_order(self):
+        upstream = self.closure.get_upstream(("totals", "total"))
+        self.assertLess(upstream.index(("users", "id")), upstream.index(("customers", "spent")))
+
+    def test_get_affected_exposures(self):
+        self.assertEqual(
+            self.closure.get_affected_exposures([("users", "email")]),
+            {"exposure.crm", "exposure.users"},
+        )
+        self.assertEqual(
+            self.closure.get_affected_exposures([("orders", "amount")]), {"exposure.finance"}
+        )
+
+    def test_find(self):
+        self.assertEqual(self.closure.find(("users", "EMAIL")), ("users", "email"))
+        self.assertEqual(self.closure.find(("users", "email")), ("users", "email"))
+        self.assertIsNone(self.closure.find(("Users", "email")))
+        self.assertIsNone(self.closure.find(("users", "name")))
+
+    def test_find_ambiguous(self):
+        # quoted names may differ in case only
+        models = [
+            ModelColumnsLineage(name="seed", columns=[ColumnLineage(name="Id")]),
+            ModelColumnsLineage(name="seed", columns=[ColumnLineage(name="ID")]),
+        ]
+        closure = ColumnClosure.from_models(models)
+
+        self.assertEqual(closure.find(("seed", "ID")), ("seed", "ID"))
+        self.assertIsNone(closure.find(("seed", "id")))
+
+    def test_cycle(self):
+        models = [
+            ModelColumnsLineage(name="a", columns=[_column("x", "b.x")]),
+            ModelColumnsLineage(name="b", columns=[_column("x", "a.x")]),
+        ]
+        with self.assertRaises(ValueError):
+            ColumnClosure.from_models(models)
@@ -0,0 +1,122 @@
+import io
+import re
+import unittest
+from typing import Dict, List, Set, Tuple
+
+from dbt_column_lineage.dbt.schemas.lineage import (
+    ColumnLineage,
+    ModelColumnsLineage,
+    ModelsColumnsLineage,
+    Source,
+)
+from dbt_column_lineage.dbt.services.docs import _build_graph, write_lineage_dot
+
+ID = r'"(?:[^"\\]|\\.)*"|[^\s"\[\]]+'
+ATTR_PATTERN = re.compile(r"(\w+)=({})".format(ID))
+SUBGRAPH_PATTERN = re.compile(r"subgraph ({}) {{$".format(ID))
+EDGE_PATTERN = re.compile(r"({0}) -> ({0}) \[(.*)\]$".format(ID))
+NODE_PATTERN = re.compile(r"({}) \[(.*)\]$".format(ID))
+
+# raw isn't a part of lineage, events is skipped, so both have referenced columns only
+MODELS = [
+    ModelColumnsLineage(
+        name="sessions",
+        columns=[
+            ColumnLineage(name="id", sources=[Source(name="events", columns=["session_id"])]),
+            ColumnLineage(
+                name="duration",
+                formula="max(ts) - min(ts)",
+                sources=[Source(name="events", columns=["ts"])],
+            ),
+            ColumnLineage(
+                name="user_id",
+                formula="coalesce(user_id, raw.uid)",
+                sources=[
+                    Source(name="events", columns=["user_id"]),
+                    Source(name="raw", columns=["uid"]),
+                ],
+            ),
+        ],
+    ),
+    ModelColumnsLineage(
+        name="users",
+        columns=[
+            ColumnLineage(name="id", sources=[Source(name="sessions", columns=["user_id"])]),
+            ColumnLineage(name="visits"),
+        ],
+    ),
+    ModelColumnsLineage(name="events", columns=[], skipped_reason="budget exceeded"),
+]
+
+
+def _unquote(value: str) -> str:
+    if value.startswith('"'):
+        return value[1:-1].replace('\\"', '"')
+
+    return value
+
+
+def _parse_attrs(attrs: str) -> Dict[str, str]:
+    return {name: _unquote(value) for name, value in ATTR_PATTERN.findall(attrs)}
+
+
+def _parse_statements(source: str) -> Tuple[Dict[str, Set[str]], Dict[str, Tuple], List[Tuple]]:
+    # ids of nodes differ between writers, so nodes are keyed by clusters and labels
+    clusters: Dict[str, Set[str]] = {}
+    nodes: Dict[str, Tuple] = {}
+    edges = []
+    cluster = None
+
+    for line in map(str.strip, source.splitlines()):
+        subgraph = SUBGRAPH_PATTERN.match(line)
+        edge = EDGE_PATTERN.match(line)
+        node = NODE_PATTERN.match(line)
+
+        if subgraph:
+            cluster = _unquote(subgraph.group(1))[len("cluster_") :]
+            clusters.setdefault(cluster, set())
+        elif line == "}":
+            cluster = None
+        elif edge:
+            edges.append((edge.group(1), edge.group(2), _parse_attrs(edge.group(3))))
+        elif node and node.group(1) not in ("graph", "node", "edge"):
+            attrs = _parse_attrs(node.group(2))
+            nodes[node.group(1)] = ("point",) if cluster is None else (cluster, attrs["label"])
+            clusters.get(cluster, set()).add(attrs.get("label"))
+
+    return clusters, nodes, edges
+
+
+def _parse_dot(source: str) -> Tuple[Dict[str, Set[str]], Set[Tuple]]:
+    clusters, nodes, edges = _parse_statements(source)
+
+    # a point joining many sources is named by a column it leads to
+    for tail, head, _ in edges:
+        if nodes[tail] == ("point",):
+            nodes[tail] = ("point", *nodes[head])
+
+    return clusters, {
+        (nodes[tail], nodes[head], attrs.get("label", ""), attrs.get("dir", ""))
+        for tail, head, attrs in edges
+    }
+
+
+class TestWriteLineageDot(unittest.TestCase):
+    def test_same_as_drawn(self):
+        drawn = _build_graph(ModelsColumnsLineage(models=MODELS)).source
+        output = io.StringIO()
+        write_lineage_dot(iter(MODELS), output)
+
+        self.assertEqual(_parse_dot(output.getvalue()), _parse_dot(drawn))
+
+    def test_referenced_columns_of_skipped_model(self):
+        output = io.StringIO()
+        write_lineage_dot(iter(MODELS), output)
+        clusters, _ = _parse_dot(output.getvalue())
+
+        self.assertEqual(clusters["events"], {"session_id", "ts", "user_id"})
+        self.assertEqual(clusters["raw"], {"uid"})
+
+
+if __name__ == "__main__":
+    unittest.main()
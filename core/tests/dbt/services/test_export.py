@@ -0,0 +1,20 @@
+import unittest
+
+from dbt_column_lineage.dbt.services.export import iter_chunks
+
+
+class TestIterChunks(unittest.TestCase):
+    def test_chunks(self):
+        self.assertEqual(list(iter_chunks(range(5), 2)), [[0, 1], [2, 3], [4]])
+
+    def test_no_items(self):
+        self.assertEqual(list(iter_chunks([], 2)), [])
+
+    def test_not_positive_chunk_size(self):
+        for chunk_size in (0, -1):
+            with self.assertRaises(ValueError):
+                list(iter_chunks(range(5), chunk_size))
+
+
+if __name__ == "__main__":
+    unittest.main()
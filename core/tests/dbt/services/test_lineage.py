@@ -0,0 +1,111 @@
+import unittest
+from types import SimpleNamespace
+from typing import Dict, Iterable, Set, Tuple
+
+from dbt.node_types import NodeType
+from dbt_column_lineage.dbt.services.columns import ColumnResolution, ColumnsLookup
+from dbt_column_lineage.dbt.services.lineage import (
+    get_model_columns_lineage,
+    invalidate_columns,
+)
+
+
+class FakeIntrospector:
+    def __init__(self, columns: Dict[str, Tuple[str, ...]]):
+        self.adapter = None
+        self.columns = columns
+        self.invalidated: Set[str] = set()
+
+    def get_columns(self, dbt_relation) -> Tuple[str, ...]:
+        return self.columns[dbt_relation.path.identifier]
+
+    def invalidate(self, dbt_relations: Iterable):
+        self.invalidated.update(dbt_relation.path.identifier for dbt_relation in dbt_relations)
+
+
+def _node(
+    name: str,
+    sql: str,
+    *depends_on_nodes: str,
+    ephemeral: bool = False,
+    resource_type: NodeType = NodeType.Model,
+):
+    return SimpleNamespace(
+        unique_id="{}.shop.{}".format(resource_type, name),
+        name=name,
+        resource_type=resource_type,
+        compiled_sql=sql,
+        depends_on_nodes=list(depends_on_nodes),
+        is_ephemeral_model=ephemeral,
+        database="db",
+        schema="analytics",
+        alias=name,
+    )
+
+
+# events is ephemeral and selects from a source only, sessions inline it
+EVENTS = _node("events", "select id, ts from raw.events", "source.shop.raw.events", ephemeral=True)
+SESSIONS = _node(
+    "sessions",
+    "with __dbt__cte__events as (select id, ts from raw.events) "
+    "select id, max(ts) as ended_at from __dbt__cte__events group by id",
+    "model.shop.events",
+)
+MANIFEST = SimpleNamespace(nodes={node.unique_id: node for node in (EVENTS, SESSIONS)})
+
+
+# people is a seed, customers select from it, reports from customers
+PEOPLE = _node("people", "", resource_type=NodeType.Seed)
+CUSTOMERS = _node("customers", "select id from analytics.people", "seed.shop.people")
+REPORTS = _node("reports", "select id from analytics.customers", "model.shop.customers")
+SHOP_MANIFEST = SimpleNamespace(
+    nodes={node.unique_id: node for node in (PEOPLE, CUSTOMERS, REPORTS, EVENTS, SESSIONS)}
+)
+
+
+def _get_columns_lookup(declared: Dict[str, Tuple[str, ...]]) -> ColumnsLookup:
+    resolutions = [ColumnResolution.DECLARED, ColumnResolution.WAREHOUSE]
+    return ColumnsLookup(FakeIntrospector({}), resolutions, declared, {})
+
+
+class TestEphemeralModelOfSources(unittest.TestCase):
+    def test_consumers_skipped_without_declared_columns(self):
+        columns_lookup = _get_columns_lookup({})
+
+        for node in (EVENTS, SESSIONS):
+            lineage = get_model_columns_lineage(columns_lookup, MANIFEST, node)
+
+            self.assertEqual(lineage.columns, [])
+            self.assertIn("model.shop.events depends only on sources", lineage.skipped_reason)
+
+    def test_declared_columns(self):
+        columns_lookup = _get_columns_lookup({"model.shop.events": ("id", "ts")})
+        lineage = get_model_columns_lineage(columns_lookup, MANIFEST, SESSIONS)
+
+        self.assertIsNone(lineage.skipped_reason)
+        self.assertEqual([column.name for column in lineage.columns], ["id", "ended_at"])
+        self.assertEqual(lineage.columns[1].sources[0].columns, ["ts"])
+
+
+class TestInvalidateColumns(unittest.TestCase):
+    def _get_invalidated(self, *unique_ids: str) -> Set[str]:
+        introspector = FakeIntrospector({})
+        invalidate_columns(introspector, SHOP_MANIFEST, unique_ids)
+        return introspector.invalidated
+
+    def test_relations_read_by_children(self):
+        # a changed seed and its children are parsed again
+        invalidated = self._get_invalidated(
+            "seed.shop.people", "model.shop.customers", "model.shop.reports"
+        )
+        self.assertEqual(invalidated, {"people", "customers"})
+
+    def test_relations_of_parents(self):
+        self.assertEqual(self._get_invalidated("model.shop.reports"), {"customers"})
+
+    def test_ephemeral_models_skipped(self):
+        self.assertEqual(self._get_invalidated("model.shop.events", "model.shop.sessions"), set())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,42 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from dbt_column_lineage.dbt.services.watch import FilesWatcher
+
+
+class TestFilesWatcher(unittest.TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.root)
+        os.makedirs(os.path.join(self.root, "models"))
+
+    def write(self, path: str, mtime: float):
+        path = os.path.join(self.root, path)
+
+        with open(path, "w") as f:
+            f.write("")
+
+        os.utime(path, (mtime, mtime))
+
+    def test_node_and_schema_files(self):
+        for path in ("models/orders.sql", "models/schema.yml", "models/README.md"):
+            self.write(path, 1)
+
+        watcher = FilesWatcher(self.root, ["models"])
+
+        for path in ("models/orders.sql", "models/schema.yml", "models/README.md"):
+            self.write(path, 2)
+
+        self.write("models/sources.yaml", 2)
+        os.remove(os.path.join(self.root, "models/orders.sql"))
+
+        self.assertEqual(
+            watcher.poll(), ["models/orders.sql", "models/schema.yml", "models/sources.yaml"]
+        )
+        self.assertEqual(watcher.poll(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+import sys
+import unittest
+
+from dbt_column_lineage.parser.schemas.formula import (
+    PASS_THROUGH,
+    TRUNCATION_MARK,
+    FormulaFactory,
+    FormulaTemplate,
+)
+
+PLUS_ONE = FormulaTemplate(parts=("", " + 1"), positions=(0,))
+SUM = FormulaTemplate(parts=("", " + ", ""), positions=(0, 1))
+PARENTHESES = FormulaTemplate(parts=("(", ")"), positions=(0,))
+
+
+class TestFormula(unittest.TestCase):
+    def setUp(self):
+        self.formulas = FormulaFactory()
+
+    def test_render(self):
+        amount = self.formulas.column("amount")
+        formula = self.formulas.bind(SUM, [self.formulas.bind(PLUS_ONE, [amount]), amount])
+
+        self.assertEqual(formula.render(), "amount + 1 + amount")
+        self.assertFalse(formula.is_column)
+
+    def test_pass_through(self):
+        amount = self.formulas.column("amount")
+
+        self.assertIs(self.formulas.bind(PASS_THROUGH, [amount]), amount)
+        self.assertTrue(amount.is_column)
+
+    def test_literal_not_column(self):
+        literal = self.formulas.bind(FormulaTemplate(parts=("amount",), positions=()), [])
+
+        self.assertIsNot(literal, self.formulas.column("amount"))
+        self.assertFalse(literal.is_column)
+
+    def test_identical_formulas_shared(self):
+        amount = self.formulas.column("amount")
+
+        self.assertIs(self.formulas.column("amount"), amount)
+        self.assertIs(
+            self.formulas.bind(PLUS_ONE, [amount]), self.formulas.bind(PLUS_ONE, [amount])
+        )
+
+    def test_truncation(self):
+        formula = self.formulas.bind(PLUS_ONE, [self.formulas.column("amount")])
+
+        self.assertEqual(formula.render(max_length=6), "amount" + TRUNCATION_MARK)
+        self.assertEqual(formula.render(max_length=10), "amount + 1")
+
+    def test_deep_chain(self):
+        # deeper than the recursion limit, as of a long chain of ctes
+        depth = sys.getrecursionlimit() + 100
+        formula = self.formulas.column("amount")
+
+        for _ in range(depth):
+            formula = self.formulas.bind(PARENTHESES, [formula])
+
+        self.assertEqual(formula.render(), "(" * depth + "amount" + ")" * depth)
+
+    def test_repeated_subtrees_truncated(self):
+        # text doubles at every level, it's never built whole if truncated
+        formula = self.formulas.column("amount")
+
+        for _ in range(100):
+            formula = self.formulas.bind(SUM, [formula, formula])
+
+        self.assertIs(formula.args[0], formula.args[1])
+        self.assertEqual(formula.render(max_length=20), "amount + amount + am" + TRUNCATION_MARK)
+
+    def test_map_parts(self):
+        amount = self.formulas.column("amount")
+        formula = self.formulas.bind(SUM, [self.formulas.bind(PLUS_ONE, [amount]), amount])
+        mapped = self.formulas.map_parts(formula, str.upper)
+
+        self.assertEqual(mapped.render(), "AMOUNT + 1 + AMOUNT")
+        self.assertIs(mapped.args[0].args[0], mapped.args[1])
+        self.assertTrue(mapped.args[1].is_column)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,31 @@
+import unittest
+
+from dbt_column_lineage.parser.services.template import TemplateCache
+
+
+class TestTemplateCache(unittest.TestCase):
+    def test_least_recently_used_dropped(self):
+        templates = TemplateCache(size=2)
+        templates.set("a", ())
+        templates.set("b", ())
+        templates.get("a")
+        templates.set("c", ())
+
+        self.assertEqual(templates.get("a"), ())
+        self.assertIsNone(templates.get("b"))
+        self.assertEqual(templates.get("c"), ())
+        self.assertEqual((templates.hits, templates.misses), (3, 1))
+
+    def test_set_again_not_dropped(self):
+        templates = TemplateCache(size=2)
+        templates.set("a", ())
+        templates.set("b", ())
+        templates.set("a", ())
+        templates.set("c", ())
+
+        self.assertIsNone(templates.get("b"))
+        self.assertEqual(templates.get("a"), ())
+
+
+if __name__ == "__main__":
+    unittest.main()
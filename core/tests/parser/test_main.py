@@ -0,0 +1,155 @@
+import unittest
+from typing import Dict, Sequence
+
+from dbt_column_lineage.parser.main import resolve_columns_lineage
+from dbt_column_lineage.parser.schemas.relation import Path, Relation
+from dbt_column_lineage.parser.services.template import TemplateCache
+
+
+def _relation(*names: str, field_names=("id", "amount")) -> Relation:
+    return Relation(path=Path.from_args(list(names)), field_names=field_names)
+
+
+ORDERS = _relation("analytics", "orders")
+REFUNDS = _relation("analytics", "refunds")
+CUSTOMERS = _relation("analytics", "customers", field_names=("customer_id", "name"))
+
+
+def _get_formulas(sql: str, relations: Sequence[Relation], **kwargs) -> Dict[str, str]:
+    lineage = resolve_columns_lineage(sql, relations, **kwargs)
+    return {name: column.formula for name, column in lineage.items()}
+
+
+class TestFormulas(unittest.TestCase):
+    def test_fields_bounds(self):
+        sql = "select amount + 1 as bumped, amount * 2 as doubled, id from analytics.orders"
+        formulas = _get_formulas(sql, [ORDERS])
+
+        self.assertEqual(formulas, {"bumped": "amount + 1", "doubled": "amount * 2", "id": ""})
+
+    def test_pass_through(self):
+        sql = """
+        with renamed as (select o.amount as total, amount + 1 as bumped from analytics.orders o)
+        select total as sum, renamed.bumped, total + 1 as incremented from renamed
+        """
+        expected = {"sum": "", "bumped": "amount + 1", "incremented": "amount + 1"}
+
+        self.assertEqual(_get_formulas(sql, [ORDERS]), expected)
+        self.assertEqual(_get_formulas(sql, [ORDERS], templates=TemplateCache()), expected)
+
+    def test_ctes_substituted(self):
+        sql = """
+        with a as (select amount + 1 as bumped from analytics.orders),
+        b as (select bumped as price from a)
+        select price + price as doubled, price from b
+        """
+        formulas = _get_formulas(sql, [ORDERS])
+
+        self.assertEqual(formulas, {"doubled": "amount + 1 + amount + 1", "price": "amount + 1"})
+
+    def test_max_formula_length(self):
+        sql = "select amount + 1 as bumped, id from analytics.orders"
+        formulas = _get_formulas(sql, [ORDERS], max_formula_length=6)
+
+        self.assertEqual(formulas, {"bumped": "amount...", "id": ""})
+
+
+class TestStars(unittest.TestCase):
+    def test_stars_expanded_in_place(self):
+        sql = """
+        select o.amount as paid, c.*, 1 as one, o.*
+        from analytics.orders as o join analytics.customers as c on o.id = c.customer_id
+        """
+        lineage = resolve_columns_lineage(sql, [ORDERS, CUSTOMERS])
+
+        self.assertEqual(list(lineage), ["paid", "customer_id", "name", "one", "id", "amount"])
+
+    def test_stars_of_all_sources(self):
+        sql = """
+        with paid as (select id, amount * 2 as amount from analytics.orders)
+        select * from paid join analytics.customers on id = customer_id
+        """
+        lineage = resolve_columns_lineage(sql, [ORDERS, CUSTOMERS])
+
+        self.assertEqual(list(lineage), ["id", "amount", "customer_id", "name"])
+        self.assertEqual(lineage["amount"].formula, "amount * 2")
+        self.assertEqual(lineage["name"].lineage, {CUSTOMERS: ["name"]})
+
+    def test_stars_of_columns(self):
+        sql = """
+        with paid as (select * from analytics.orders),
+        tagged as (select paid.*, 'x' as tag from paid)
+        select * from tagged
+        """
+        lineage = resolve_columns_lineage(sql, [ORDERS], columns=["amount"])
+
+        self.assertEqual(list(lineage), ["amount"])
+        self.assertEqual(lineage["amount"].lineage, {ORDERS: ["amount"]})
+
+    def test_stars_of_columns_in_any_case(self):
+        relation = _relation("analytics", "seed", field_names=("ID", "AMOUNT"))
+        sql = "with paid as (select * from analytics.seed) select * from paid"
+        lineage = resolve_columns_lineage(sql, [relation], columns=["amount"])
+
+        self.assertEqual(list(lineage), ["AMOUNT"])
+        self.assertEqual(lineage["AMOUNT"].lineage, {relation: ["AMOUNT"]})
+
+
+class TestReachableCtes(unittest.TestCase):
+    def test_unused_cte_of_unknown_relation(self):
+        sql = """
+        with unused as (select * from analytics.unknown),
+        paid as (select id, amount from analytics.orders),
+        doubled as (select id, amount * 2 as amount from paid)
+        select id, amount from doubled
+        """
+        lineage = resolve_columns_lineage(sql, [ORDERS])
+
+        self.assertEqual(lineage["amount"].formula, "amount * 2")
+        self.assertEqual(lineage["amount"].lineage, {ORDERS: ["amount"]})
+
+
+class TestTemplateCache(unittest.TestCase):
+    def setUp(self):
+        self.templates = TemplateCache()
+
+    def assert_cached_equal(self, sql: str, relations: Sequence[Relation]):
+        cached = resolve_columns_lineage(sql, relations, templates=self.templates)
+        self.assertEqual(cached, resolve_columns_lineage(sql, relations))
+
+    def test_models_sharing_template(self):
+        sql = "select o.id, o.amount * 2 as doubled, 'eur' as currency from analytics.{} as o"
+
+        self.assert_cached_equal(sql.format("orders"), [ORDERS])
+        self.assert_cached_equal(sql.format("refunds"), [REFUNDS])
+        self.assertEqual((self.templates.hits, self.templates.misses), (1, 1))
+
+    def test_literals(self):
+        sql = """
+        select id, 'x' as tag, b'101' as mask, x'1f' as checksum, amount || ' eur' as price
+        from analytics.{}
+        """
+
+        self.assert_cached_equal(sql.format("orders"), [ORDERS])
+        self.assert_cached_equal(sql.format("refunds"), [REFUNDS])
+
+        refunds = resolve_columns_lineage(
+            sql.format("refunds"), [REFUNDS], templates=self.templates
+        )
+        formulas = {name: column.formula for name, column in refunds.items()}
+        self.assertEqual(formulas["tag"], "'x'")
+        self.assertEqual(formulas["mask"], "b'101'")
+        self.assertEqual(formulas["checksum"], "x'1f'")
+        self.assertEqual(formulas["price"], "amount || ' eur'")
+
+    def test_initial_relation_not_in_sql(self):
+        # e.g. a model depending on another one only by a macro
+        sql = "select o.id, o.amount from analytics.orders as o"
+
+        self.assert_cached_equal(sql, [ORDERS, CUSTOMERS])
+        self.assert_cached_equal(sql, [ORDERS, CUSTOMERS])
+        self.assertEqual((self.templates.hits, self.templates.misses), (1, 1))
+
+
+if __name__ == "__main__":
+    unittest.main()